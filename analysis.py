@@ -5,10 +5,9 @@ Converts NWS forecast temperatures into Gaussian-implied probabilities,
 then compares them against Kalshi market prices to find gaps.
 """
 
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
+from datetime import datetime, timedelta, timezone
 from scipy.stats import norm
-from config import CITIES, MIN_GAP_TO_SHOW, log
+from config import CITIES, MIN_GAP_TO_SHOW, log, _et_now
 
 
 # ============================================================
@@ -85,17 +84,22 @@ def estimate_remaining_extreme(hourly_data, city_key, extreme_type):
     would apply a DST correction for affected months.
     """
     lst_offset = CITIES[city_key]["lst_utc_offset"]
-    now_lst    = datetime.utcnow() + timedelta(hours=lst_offset)
-    today_lst  = now_lst.date()
+    now_lst    = datetime.now(timezone.utc) + timedelta(hours=lst_offset)
+
+    # Hourly keys look like "2026-02-19T14:00" — fixed-width, so plain string
+    # comparison orders them the same way as the times they stand for. That
+    # lets us filter without parsing every key back into a datetime.
+    #   today_str  — "2026-02-19": the key must be on today's LST date
+    #   first_hour — "2026-02-19T15:00": the first hour after the current one
+    #                (at 23:xx this is "T24:00", which no key reaches — correct,
+    #                there are no hours left today)
+    today_str  = now_lst.strftime("%Y-%m-%d")
+    first_hour = f"{today_str}T{now_lst.hour + 1:02d}:00"
 
     future_temps = []
     for time_str, temp_f in hourly_data.items():
-        try:
-            dt = datetime.strptime(time_str, "%Y-%m-%dT%H:%M")
-        except ValueError:
-            continue
         # Only include hours that are both on today's LST date AND in the future
-        if dt.date() == today_lst and dt.hour > now_lst.hour:
+        if time_str[:10] == today_str and time_str >= first_hour:
             future_temps.append(temp_f)
 
     if not future_temps:
@@ -186,7 +190,7 @@ def analyze_gaps(city_key, kalshi_markets, nws_forecast, city_forecasts=None):
     # Use ET dates, not UTC. On Railway the system clock is UTC, so at 11 PM ET
     # datetime.now().date() returns tomorrow's UTC date — all "tomorrow" markets
     # would be mis-labelled as "unknown date" and silently dropped.
-    et_now   = datetime.now(tz=ZoneInfo("America/New_York"))
+    et_now   = _et_now()
     today    = et_now.date()
     tomorrow = today + timedelta(days=1)
 
@@ -20,11 +20,7 @@ from datetime import datetime
 from config import (
     CITIES, RUN_EVERY_MINUTES, SEND_TEST_EMAIL, log, _et_now,
 )
-from models import (
-    fetch_kalshi_markets, fetch_nws_forecast,
-    fetch_ecmwf_forecast, fetch_gfs_forecast, fetch_gem_forecast,
-    fetch_icon_forecast, fetch_hourly_forecast, fetch_weatherapi_forecast,
-)
+from models import fetch_all_kalshi_markets, fetch_city_forecasts
 from analysis import analyze_gaps
 from alerts import (
     format_alert_message, format_evening_summary,
@@ -71,7 +67,9 @@ def run_cycle():
 
     Order of operations per city:
       1. fetch_kalshi_markets()     — live market prices + bucket shapes
-      2. fetch_nws_forecast()       — NWS grid forecast + running high
+                                      (all cities fetched in parallel first)
+      2. fetch_city_forecasts()     — NWS grid forecast + running high and
+                                      all other models, fetched in parallel
       3. analyze_gaps()             — compare NWS-implied prob vs Kalshi price
 
     After all cities, decides what (if anything) to email:
@@ -92,30 +90,36 @@ def run_cycle():
 
     log.info(f"Starting full cycle — {len(CITIES)} cities to process.")
 
+    # Fetch every city's Kalshi markets up front, in parallel — these calls
+    # are pure network waiting, so overlapping them saves most of the time.
+    all_kalshi_markets = fetch_all_kalshi_markets(list(CITIES))
+
     for city_key, city_config in CITIES.items():
         try:
-            # ── Step 1: Kalshi markets ───────────────────────────────────────
-            kalshi_markets = fetch_kalshi_markets(city_key)
+            # ── Step 1: Kalshi markets (already fetched above) ───────────────
+            kalshi_markets = all_kalshi_markets.get(city_key, [])
             if not kalshi_markets:
                 log.warning(f"[{city_key}] 0 markets returned — skipping city.")
                 cities_failed += 1
                 continue
 
-            # ── Step 2: NWS forecast + running high ─────────────────────────
-            nws_forecast = fetch_nws_forecast(city_key)
+            # ── Steps 2+3: NWS forecast + running high, multi-model forecasts ─
+            # All sources are fetched at the same time (see fetch_city_forecasts).
+            # Only NWS is required — NWS drives signals. The other six can
+            # fail without skipping the city.
+            city_forecasts = fetch_city_forecasts(city_key)
+            nws_forecast   = city_forecasts["nws"]
             if nws_forecast is None:
                 log.warning(f"[{city_key}] NWS forecast unavailable — skipping city.")
                 cities_failed += 1
                 continue
 
-            # ── Step 3: Multi-model forecasts (non-blocking) ─────────────────
-            # All six can fail without skipping the city — NWS drives signals.
-            ecmwf_forecast      = fetch_ecmwf_forecast(city_key)
-            gfs_forecast        = fetch_gfs_forecast(city_key)
-            gem_forecast        = fetch_gem_forecast(city_key)
-            icon_forecast       = fetch_icon_forecast(city_key)
-            weatherapi_forecast = fetch_weatherapi_forecast(city_key)
-            hourly_forecast     = fetch_hourly_forecast(city_key)
+            ecmwf_forecast      = city_forecasts["ecmwf"]
+            gfs_forecast        = city_forecasts["gfs"]
+            gem_forecast        = city_forecasts["gem"]
+            icon_forecast       = city_forecasts["icon"]
+            weatherapi_forecast = city_forecasts["weatherapi"]
+            hourly_forecast     = city_forecasts["hourly"]
 
             # Log whether each model returned data or None
             def _fc_status(fc, label):
@@ -134,17 +138,6 @@ def run_cycle():
                 ])
             )
 
-            # Bundle forecasts so analyze_gaps() can compute dynamic std_dev
-            city_forecasts = {
-                "nws":        nws_forecast,
-                "ecmwf":      ecmwf_forecast,
-                "gfs":        gfs_forecast,
-                "gem":        gem_forecast,
-                "icon":       icon_forecast,
-                "weatherapi": weatherapi_forecast,
-                "hourly":     hourly_forecast,
-            }
-
             # ── Step 4: Gap analysis ─────────────────────────────────────────
             gaps = analyze_gaps(city_key, kalshi_markets, nws_forecast, city_forecasts)
             all_results[city_key]   = gaps
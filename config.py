@@ -4,8 +4,16 @@ and the _et_now() time utility used across all modules.
 """
 
 import os
+import time
+import calendar
 import logging
-from datetime import datetime, timedelta
+import threading
+from functools import lru_cache
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from types import MappingProxyType
+from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 
@@ -31,12 +39,90 @@ WEATHERAPI_KEY   = os.getenv("WEATHERAPI_KEY")     # weatherapi.com — free tie
 # The Kalshi REST API base URL (confirmed — all markets live here, no auth needed for reads)
 KALSHI_BASE_URL = "https://api.elections.kalshi.com/trade-api/v2"
 
+# ============================================================
+# HTTP SESSION
+# ============================================================
+
+# One shared HTTP session for every API call (Kalshi, NWS, Open-Meteo,
+# WeatherAPI). A Session keeps the TCP/TLS connection open between requests
+# (keep-alive), so the second and later calls to the same host skip the
+# connection handshake entirely.
+# pool_connections = how many hosts to keep pools for (we talk to 4).
+# pool_maxsize     = how many open connections per host the session may keep.
+# NWS requires a User-Agent header identifying your app — requests without it
+# may be rejected — so it's set once here for every call.
+#
+# Retry: NWS in particular returns the odd 502/503 that succeeds a moment
+# later. The adapter retries GETs that hit a rate limit or gateway error up
+# to 3 times with a short exponential backoff (0.3s, 0.6s, 1.2s), honouring
+# any Retry-After header. raise_on_status=False hands the last response back
+# so each caller's raise_for_status() still logs the real status code.
+#
+# Only fast failures are retried. read=0 means a request that timed out
+# waiting for a response is NOT sent again — a hung server would otherwise
+# cost 4× the timeout per call and stretch a cycle past its 10 minutes.
+# Failed connection attempts (DNS, refused) fail quickly, so 2 retries.
+HTTP_RETRY = Retry(
+    total=3,
+    connect=2,
+    read=0,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=("GET",),
+    raise_on_status=False,
+)
+
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "KalshiClimateBot/1.0"})
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=HTTP_RETRY))
+
+# ============================================================
+# KALSHI RATE LIMIT
+# ============================================================
+
+class TokenBucket:
+    """
+    A small thread-safe token bucket. acquire() takes one token, waiting
+    first if none are left. Tokens refill at `rate` per second, up to
+    `capacity` saved up — so a short burst goes out immediately, and a long
+    run of calls settles at `rate` requests per second no matter how many
+    threads are making them.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate     = rate
+        self.capacity = capacity
+        self.tokens   = capacity
+        self.updated  = time.monotonic()
+        self.lock     = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            # Refill for the time since the last call, capped at capacity
+            self.tokens  = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Take a token. If that leaves us in debt, sleep until it is paid
+            # back. Sleeping while holding the lock makes the other threads
+            # queue behind us, so they go out in order at the steady rate.
+            self.tokens -= 1
+            if self.tokens < 0:
+                time.sleep(-self.tokens / self.rate)
+
+
+# One budget shared by every Kalshi request (market lists in models.py, paper
+# trading and resolve.py), however many worker threads are making them: up to 4 calls
+# back-to-back, then 8 per second.
+KALSHI_RATE_LIMIT = TokenBucket(rate=8, capacity=4)
+
 # ============================================================
 # CITY CONFIGURATION
 # ============================================================
 
 # Cities that get full signal cards in email alerts (historically more reliable markets).
-TIER1_CITIES = {"PHX", "MIA", "LAS", "HOU", "SAT", "DAL"}
+# frozenset: fixed at import, same O(1) membership test as a set, can't be
+# modified by accident.
+TIER1_CITIES = frozenset({"PHX", "MIA", "LAS", "HOU", "SAT", "DAL"})
 
 # Each city entry contains:
 #   name         — display name for alerts
@@ -229,6 +315,25 @@ CITIES = {
     },
 }
 
+# Freeze the top-level city table: every module imports CITIES, so a stray
+# CITIES[...] = ... anywhere would silently change the config for the whole
+# bot. MappingProxyType is a read-only view — reads work exactly like a dict
+# (CITIES["NYC"], .get(), .items(), len()), writes raise TypeError.
+CITIES = MappingProxyType(CITIES)
+
+# Kalshi series each city actually trades, precomputed once at import.
+# Cities without a LOW series simply have one entry instead of two, so
+# callers can loop over this directly — no None checks needed.
+# Format: {"NYC": (("HIGH", "KXHIGHNY"), ("LOW", "KXLOWTNYC")), "PHX": (("HIGH", "KXHIGHTPHX"),), ...}
+CITY_SERIES = {
+    city_key: tuple(
+        (series_type, series)
+        for series_type, series in (("HIGH", city["high_series"]), ("LOW", city["low_series"]))
+        if series is not None
+    )
+    for city_key, city in CITIES.items()
+}
+
 # ============================================================
 # BOT CONFIGURATION
 # ============================================================
@@ -244,6 +349,10 @@ LOG_FILE    = os.getenv("LOG_PATH",         "log.csv")
 LOG_PATH    = LOG_FILE   # alias used by export_server
 RESOLVE_LOG = os.getenv("RESOLVE_LOG_PATH", "resolve_log.csv")
 
+# NWS grid lookups (office/gridX/gridY) never change for a fixed lat/lon, so
+# models.py saves them here and reloads them on restart.
+NWS_GRID_CACHE_FILE = os.getenv("NWS_GRID_CACHE_PATH", "nws_grid_cache.json")
+
 # ============================================================
 # LOGGING SETUP
 # ============================================================
@@ -259,6 +368,44 @@ log = logging.getLogger(__name__)
 # TIME UTILITY
 # ============================================================
 
+# Eastern Time zone object, built once and shared by every module instead of
+# calling ZoneInfo("America/New_York") on each use.
+ET_TZ = ZoneInfo("America/New_York")
+
+
 def _et_now():
     """Returns the current datetime in America/New_York (Eastern Time)."""
-    return datetime.now(tz=ZoneInfo("America/New_York"))
+    return datetime.now(tz=ET_TZ)
+
+
+# Kalshi tickers spell the month as three capital letters, e.g. "26FEB18".
+# Looking it up in a dict is much cheaper than datetime.strptime(), which
+# re-parses its format string on every call — and this runs once per row
+# of log.csv in resolve.py.
+_TICKER_MONTHS = {
+    "JAN": 1, "FEB": 2, "MAR": 3, "APR": 4,  "MAY": 5,  "JUN": 6,
+    "JUL": 7, "AUG": 8, "SEP": 9, "OCT": 10, "NOV": 11, "DEC": 12,
+}
+
+
+# The bot logs every market every 10 minutes, so log.csv repeats the same few
+# hundred tickers thousands of times — remember each ticker's date once parsed.
+@lru_cache(maxsize=4096)
+def _ticker_market_date(ticker):
+    """
+    Returns the market's date from its ticker as a datetime.date,
+    e.g. "KXHIGHNY-26FEB18-B48.5" → date(2026, 2, 18). None if it doesn't parse.
+    """
+    # Shape checks up front instead of try/except, so a malformed ticker is
+    # rejected without raising (and catching) an exception.
+    parts = ticker.split("-", 2)
+    if len(parts) < 2:
+        return None
+    date_part = parts[1]   # e.g. "26FEB18" (YYMONDD)
+    if len(date_part) != 7 or not date_part[:2].isdecimal() or not date_part[5:].isdecimal():
+        return None
+    month = _TICKER_MONTHS.get(date_part[2:5])
+    day   = int(date_part[5:])
+    if month is None or not 1 <= day <= calendar.monthrange(2000 + int(date_part[:2]), month)[1]:
+        return None
+    return date(2000 + int(date_part[:2]), month, day)
@@ -49,13 +49,23 @@ class ExportHandler(BaseHTTPRequestHandler):
 
         try:
             with open(file_path, "rb") as f:
-                data = f.read()
-            self.send_response(200)
-            self.send_header("Content-Type", "text/csv")
-            self.send_header("Content-Disposition", f'attachment; filename="{filename}"')
-            self.send_header("Content-Length", str(len(data)))
-            self.end_headers()
-            self.wfile.write(data)
+                # Stream the file instead of reading it all into memory first —
+                # log.csv grows every cycle and can get large.
+                # Size comes from the open file so it matches what we send even
+                # if the bot appends a new cycle while the download is running.
+                size = os.fstat(f.fileno()).st_size
+                self.send_response(200)
+                self.send_header("Content-Type", "text/csv")
+                self.send_header("Content-Disposition", f'attachment; filename="{filename}"')
+                self.send_header("Content-Length", str(size))
+                self.end_headers()
+                self.wfile.flush()   # headers must hit the socket before the body
+
+                # socket.sendfile() lets the kernel copy file → socket directly
+                # (sendfile(2) on Linux) and automatically falls back to a plain
+                # read/send loop on platforms without it. count=size stops at
+                # the length we promised in Content-Length.
+                self.connection.sendfile(f, 0, size)
         except Exception as exc:
             log.error(f"ExportHandler error: {exc}")
             self.send_response(500)
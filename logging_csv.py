@@ -15,6 +15,45 @@ from config import CITIES, LOG_FILE, log
 # SECTION 8 — CSV LOGGING
 # ============================================================
 
+# Column order for log.csv. A tuple (not a list) because it never changes —
+# built once at import instead of on every cycle.
+FIELDNAMES = (
+    "timestamp", "city", "market_type", "bucket_label",
+    "kalshi_price", "nws_implied", "gap", "direction",
+    "confidence", "was_settled",
+    "nws_grid_forecast", "observed_running", "forecast_temp_used",
+    "ecmwf_high", "gfs_high", "gem_high", "icon_high", "weatherapi_high",
+    "consensus_high", "model_spread", "std_dev_used", "time_decay_multiplier",
+    "hourly_remaining_extreme", "hourly_adjusted",
+    "ticker", "market_date",
+)
+
+# True once log.csv is known to have its header row. None = not checked yet
+# (first cycle after startup).
+_LOG_HAS_HEADER = None
+
+
+def _check_log_schema():
+    """
+    Detects a stale log.csv schema: if the existing file still has the old
+    "nws_forecast" column (and not the new "nws_grid_forecast"), warns the
+    user to delete it. Called once per process, on the first cycle.
+    """
+    try:
+        with open(LOG_FILE, "r", encoding="utf-8") as _check:
+            first_line = _check.readline()
+        if "nws_forecast" in first_line and "nws_grid_forecast" not in first_line:
+            log.warning(
+                f"⚠️  SCHEMA CHANGE DETECTED in {LOG_FILE}: "
+                "the file uses the old 'nws_forecast' column. "
+                "Delete log.csv and restart the bot — it will recreate the file "
+                "with the new 21-column schema "
+                "(nws_grid_forecast / observed_running / forecast_temp_used)."
+            )
+    except Exception:
+        pass  # non-fatal; proceed normally
+
+
 def log_to_csv(all_results, all_forecasts):
     """
     Appends one row per market per cycle to log.csv.
@@ -64,113 +103,118 @@ def log_to_csv(all_results, all_forecasts):
     total, was 24). If log.csv exists with the old schema, delete it and restart —
     the bot will recreate it with the correct 26-column header.
     """
-    FIELDNAMES = [
-        "timestamp", "city", "market_type", "bucket_label",
-        "kalshi_price", "nws_implied", "gap", "direction",
-        "confidence", "was_settled",
-        "nws_grid_forecast", "observed_running", "forecast_temp_used",
-        "ecmwf_high", "gfs_high", "gem_high", "icon_high", "weatherapi_high",
-        "consensus_high", "model_spread", "std_dev_used", "time_decay_multiplier",
-        "hourly_remaining_extreme", "hourly_adjusted",
-        "ticker", "market_date",
-    ]
-
-    now         = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    file_exists = os.path.isfile(LOG_FILE)
-    total_rows  = 0
-
-    # Detect stale schema: if the existing file still has the old "nws_forecast"
-    # column (and not the new "nws_grid_forecast"), warn the user to delete it.
-    if file_exists:
-        try:
-            with open(LOG_FILE, "r", encoding="utf-8") as _check:
-                first_line = _check.readline()
-            if "nws_forecast" in first_line and "nws_grid_forecast" not in first_line:
-                log.warning(
-                    f"⚠️  SCHEMA CHANGE DETECTED in {LOG_FILE}: "
-                    "the file uses the old 'nws_forecast' column. "
-                    "Delete log.csv and restart the bot — it will recreate the file "
-                    "with the new 21-column schema "
-                    "(nws_grid_forecast / observed_running / forecast_temp_used)."
-                )
-        except Exception:
-            pass  # non-fatal; proceed normally
+    global _LOG_HAS_HEADER
+
+    # One timestamp string for the whole cycle, shared by every row.
+    # isoformat(sep=" ", timespec="seconds") gives the same "YYYY-MM-DD HH:MM:SS"
+    # text as strftime but without parsing a format string.
+    now         = datetime.now().isoformat(sep=" ", timespec="seconds")
+
+    # Only stat the file (and sniff its schema) on the first cycle. After that
+    # we know the header is there because we either found the file or wrote
+    # the header ourselves, and the user has to restart to replace the file.
+    if _LOG_HAS_HEADER is None:
+        _LOG_HAS_HEADER = os.path.isfile(LOG_FILE)
+        if _LOG_HAS_HEADER:
+            _check_log_schema()
+    file_exists = _LOG_HAS_HEADER
 
     try:
-        with open(LOG_FILE, "a", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
-
-            # Write header only the first time the file is created
-            if not file_exists:
-                writer.writeheader()
-                log.info(f"Created {LOG_FILE} with header row.")
-
-            for city_key, gaps in all_results.items():
-                city_name = CITIES[city_key]["name"]
-
-                # Pull the raw forecast dicts for this city (safe if missing)
-                forecasts   = all_forecasts.get(city_key, {})
-                nws_fc      = forecasts.get("nws")        or {}
-                ecmwf_fc    = forecasts.get("ecmwf")      or {}
-                gfs_fc      = forecasts.get("gfs")        or {}
-                gem_fc      = forecasts.get("gem")        or {}
-                icon_fc     = forecasts.get("icon")       or {}
-                wapi_fc     = forecasts.get("weatherapi") or {}
-
-                for g in gaps:
-                    # Build the lookup key that matches all forecast dicts:
-                    # e.g. market_date="today", series_type="HIGH" → "today_high"
-                    fc_key = f"{g['market_date']}_{g['series_type'].lower()}"
-
-                    nws_temp    = nws_fc.get(fc_key)    # NWS grid °F
-                    ecmwf_temp  = ecmwf_fc.get(fc_key)  # ECMWF IFS 0.25° °F
-                    gfs_temp    = gfs_fc.get(fc_key)    # GFS Seamless °F
-                    gem_temp    = gem_fc.get(fc_key)    # Canadian GEM Seamless °F
-                    icon_temp   = icon_fc.get(fc_key)   # DWD ICON Seamless °F
-                    wapi_temp   = wapi_fc.get(fc_key)   # WeatherAPI.com °F
-
+        # Build every row for this cycle first, then write them in one go.
+        # Rows are plain tuples in FIELDNAMES order, so csv.writer can write
+        # them directly (DictWriter would rebuild a list from each dict).
+        rows = []
+
+        for city_key, gaps in all_results.items():
+            city_name = CITIES[city_key]["name"]
+
+            # Pull the raw forecast dicts for this city (safe if missing)
+            forecasts   = all_forecasts.get(city_key, {})
+            nws_fc      = forecasts.get("nws")        or {}
+            ecmwf_fc    = forecasts.get("ecmwf")      or {}
+            gfs_fc      = forecasts.get("gfs")        or {}
+            gem_fc      = forecasts.get("gem")        or {}
+            icon_fc     = forecasts.get("icon")       or {}
+            wapi_fc     = forecasts.get("weatherapi") or {}
+
+            # Consensus/spread only depend on the forecast period (e.g. "today_high"),
+            # not on the individual bucket — a city has at most 4 periods but can
+            # have dozens of buckets. Compute each period once and reuse it.
+            # Format: {"today_high": (consensus, spread), ...}
+            period_stats = {}
+
+            for g in gaps:
+                # Build the lookup key that matches all forecast dicts:
+                # e.g. market_date="today", series_type="HIGH" → "today_high"
+                fc_key = f"{g['market_date']}_{g['series_type'].lower()}"
+
+                nws_temp    = nws_fc.get(fc_key)    # NWS grid °F
+                ecmwf_temp  = ecmwf_fc.get(fc_key)  # ECMWF IFS 0.25° °F
+                gfs_temp    = gfs_fc.get(fc_key)    # GFS Seamless °F
+                gem_temp    = gem_fc.get(fc_key)    # Canadian GEM Seamless °F
+                icon_temp   = icon_fc.get(fc_key)   # DWD ICON Seamless °F
+                wapi_temp   = wapi_fc.get(fc_key)   # WeatherAPI.com °F
+
+                if fc_key not in period_stats:
                     # Consensus = average of all available model temps (including NWS)
                     available = [t for t in [nws_temp, ecmwf_temp, gfs_temp, gem_temp, icon_temp, wapi_temp] if t is not None]
                     consensus = round(sum(available) / len(available)) if available else None
                     # Spread = range across models; high spread = stay out (low confidence)
                     spread    = (max(available) - min(available)) if len(available) >= 2 else None
+                    period_stats[fc_key] = (consensus, spread)
+
+                consensus, spread = period_stats[fc_key]
+
+                # nws_grid_forecast and observed_running come from analyze_gaps()
+                # result dict directly — they were captured there where the
+                # branching logic already knows exactly which value is which.
+                grid_fc   = g.get("nws_grid_forecast")   # raw NWS grid temp
+                obs_run   = g.get("observed_running")     # live obs (or None)
+                fc_used   = g.get("forecast_temp")        # what drove the signal
+                hourly_ex = g.get("hourly_remaining_extreme")
+
+                # Same order as FIELDNAMES — keep the two in sync.
+                rows.append((
+                    now,                                            # timestamp
+                    city_name,                                      # city
+                    g["series_type"],                               # market_type
+                    g["bucket_label"],                              # bucket_label
+                    g["kalshi_prob"],                               # kalshi_price
+                    g["nws_prob"],                                  # nws_implied
+                    g["gap"],                                       # gap
+                    g["edge"],                                      # direction
+                    g["confidence"],                                # confidence
+                    g["was_settled"],                               # was_settled
+                    grid_fc    if grid_fc    is not None else "",   # nws_grid_forecast
+                    obs_run    if obs_run    is not None else "",   # observed_running
+                    fc_used    if fc_used    is not None else "",   # forecast_temp_used
+                    ecmwf_temp if ecmwf_temp is not None else "",   # ecmwf_high
+                    gfs_temp   if gfs_temp   is not None else "",   # gfs_high
+                    gem_temp   if gem_temp   is not None else "",   # gem_high
+                    icon_temp  if icon_temp  is not None else "",   # icon_high
+                    wapi_temp  if wapi_temp  is not None else "",   # weatherapi_high
+                    consensus  if consensus  is not None else "",   # consensus_high
+                    spread     if spread     is not None else "",   # model_spread
+                    g.get("std_dev_used", ""),                      # std_dev_used
+                    g.get("time_decay_multiplier", 1.0),            # time_decay_multiplier
+                    hourly_ex  if hourly_ex  is not None else "",   # hourly_remaining_extreme
+                    g.get("hourly_adjusted", False),                # hourly_adjusted
+                    g["ticker"],                                    # ticker
+                    g["market_date"],                               # market_date
+                ))
+
+        total_rows = len(rows)
+
+        with open(LOG_FILE, "a", newline="") as f:
+            writer = csv.writer(f)
+
+            # Write header only the first time the file is created
+            if not file_exists:
+                writer.writerow(FIELDNAMES)
+                _LOG_HAS_HEADER = True
+                log.info(f"Created {LOG_FILE} with header row.")
 
-                    # nws_grid_forecast and observed_running come from analyze_gaps()
-                    # result dict directly — they were captured there where the
-                    # branching logic already knows exactly which value is which.
-                    grid_fc   = g.get("nws_grid_forecast")   # raw NWS grid temp
-                    obs_run   = g.get("observed_running")     # live obs (or None)
-                    fc_used   = g.get("forecast_temp")        # what drove the signal
-
-                    writer.writerow({
-                        "timestamp":          now,
-                        "city":               city_name,
-                        "market_type":        g["series_type"],
-                        "bucket_label":       g["bucket_label"],
-                        "kalshi_price":       g["kalshi_prob"],
-                        "nws_implied":        g["nws_prob"],
-                        "gap":                g["gap"],
-                        "direction":          g["edge"],
-                        "confidence":         g["confidence"],
-                        "was_settled":        g["was_settled"],
-                        "nws_grid_forecast":  grid_fc   if grid_fc  is not None else "",
-                        "observed_running":   obs_run   if obs_run  is not None else "",
-                        "forecast_temp_used": fc_used   if fc_used  is not None else "",
-                        "ecmwf_high":         ecmwf_temp if ecmwf_temp is not None else "",
-                        "gfs_high":           gfs_temp   if gfs_temp   is not None else "",
-                        "gem_high":           gem_temp   if gem_temp   is not None else "",
-                        "icon_high":          icon_temp  if icon_temp  is not None else "",
-                        "weatherapi_high":    wapi_temp  if wapi_temp  is not None else "",
-                        "consensus_high":     consensus  if consensus  is not None else "",
-                        "model_spread":       spread     if spread     is not None else "",
-                        "std_dev_used":          g.get("std_dev_used", ""),
-                        "time_decay_multiplier": g.get("time_decay_multiplier", 1.0),
-                        "hourly_remaining_extreme": g.get("hourly_remaining_extreme", "") if g.get("hourly_remaining_extreme") is not None else "",
-                        "hourly_adjusted":          g.get("hourly_adjusted", False),
-                        "ticker":             g["ticker"],
-                        "market_date":        g["market_date"],
-                    })
-                    total_rows += 1
+            writer.writerows(rows)
 
         log.info(f"Logged {total_rows} rows to {LOG_FILE}.")
 
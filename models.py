@@ -2,20 +2,97 @@
 models.py — All data fetching: Kalshi API, NWS, Open-Meteo, WeatherAPI.
 
 Includes market discovery, market price fetching, NWS grid forecasts,
-and four Open-Meteo model fetchers for cross-validation.
+and one Open-Meteo request covering four models for cross-validation.
 """
 
+import os
+import json
+import time
 import requests
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
-from config import CITIES, KALSHI_BASE_URL, WEATHERAPI_KEY, log
-from observations import get_current_running_high, get_current_running_low
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from config import (
+    CITIES, CITY_SERIES, KALSHI_BASE_URL, WEATHERAPI_KEY, NWS_GRID_CACHE_FILE,
+    SESSION, KALSHI_RATE_LIMIT, log, _et_now,
+)
+from observations import get_current_running_extremes
+
+
+def _load_grid_cache():
+    """
+    Loads saved NWS grid info from NWS_GRID_CACHE_FILE.
+    Returns {} if the file is missing or unreadable — the bot just falls back
+    to calling /points for each city like it would on a first run.
+    """
+    try:
+        with open(NWS_GRID_CACHE_FILE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        log.info(f"Loaded NWS grid info for {len(cache)} cities from {NWS_GRID_CACHE_FILE}.")
+        return cache
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        log.warning(f"Could not read {NWS_GRID_CACHE_FILE} ({e}) — starting with an empty grid cache.")
+        return {}
+
+
+def _save_grid_cache():
+    """
+    Writes NWS_GRID_CACHE to disk. Writes to a temp file first and then
+    swaps it in with os.replace(), so a crash mid-write never leaves a
+    half-written cache file behind. Failure is logged and otherwise ignored.
+    """
+    tmp_path = NWS_GRID_CACHE_FILE + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(NWS_GRID_CACHE, f)
+        os.replace(tmp_path, NWS_GRID_CACHE_FILE)
+    except Exception as e:
+        log.warning(f"Could not save {NWS_GRID_CACHE_FILE}: {e}")
 
 
 # Cache for NWS grid info (office, gridX, gridY) so we only look it up once
-# per city at startup rather than on every 10-minute cycle.
-# Format: {"NYC": {"office": "OKX", "grid_x": 33, "grid_y": 37, "forecast_url": "..."}}
-NWS_GRID_CACHE = {}
+# per city rather than on every 10-minute cycle. Saved to disk whenever a new
+# city is added, so a restart doesn't have to redo the /points lookups.
+# Format: {"NYC": {"office": "OKX", "grid_x": 33, "grid_y": 37, "forecast_url": "...",
+#                  "lat": 40.779, "lon": -73.9692, "cached_at": 1760000000}}
+NWS_GRID_CACHE = _load_grid_cache()
+
+# NWS only redraws its grid every few years, but re-checking once a month
+# means a redraw can never leave us on a dead forecast URL for long.
+NWS_GRID_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+
+
+def _grid_entry_is_fresh(city_key):
+    """
+    Returns True if NWS_GRID_CACHE has a usable entry for this city: one that
+    was looked up for the city's current coordinates (so editing lat/lon in
+    CITIES forces a new lookup) and is less than NWS_GRID_MAX_AGE_SECONDS old.
+    Entries saved before cached_at existed count as stale.
+    """
+    grid = NWS_GRID_CACHE.get(city_key)
+    if grid is None:
+        return False
+    city = CITIES[city_key]
+    if grid.get("lat") != city["lat"] or grid.get("lon") != city["lon"]:
+        return False
+    return time.time() - grid.get("cached_at", 0) < NWS_GRID_MAX_AGE_SECONDS
+
+
+def _fetch_series_markets(series):
+    """
+    Returns the raw list of open markets for one Kalshi series ticker.
+
+    Raises on HTTP/network errors — callers already wrap this in try/except.
+    """
+    KALSHI_RATE_LIMIT.acquire()   # shared Kalshi budget — see config.py
+    response = SESSION.get(
+        f"{KALSHI_BASE_URL}/markets",
+        params={"series_ticker": series, "status": "open", "limit": 100},
+        timeout=10,
+    )
+    response.raise_for_status()
+    return response.json().get("markets", [])
 
 
 # ============================================================
@@ -38,21 +115,10 @@ def discover_markets():
     print(f"{'='*60}\n")
 
     for city_key, city in CITIES.items():
-        # Check both HIGH and LOW series for this city
-        for market_type in ("HIGH", "LOW"):
-            series = city["high_series"] if market_type == "HIGH" else city["low_series"]
-
-            # Skip if this city has no series defined for this market type
-            if series is None:
-                continue
-
+        # Check every series this city has (HIGH, and LOW if it exists)
+        for market_type, series in CITY_SERIES[city_key]:
             try:
-                response = requests.get(
-                    f"{KALSHI_BASE_URL}/markets",
-                    params={"series_ticker": series, "status": "open", "limit": 100},
-                    timeout=10,
-                )
-                markets = response.json().get("markets", [])
+                markets = _fetch_series_markets(series)
 
                 if not markets:
                     print(f"  [{city_key}] {market_type} ({series}): 0 open markets")
@@ -79,6 +145,16 @@ def discover_markets():
 # Fetches the current markets and their yes/no prices for each city.
 # ============================================================
 
+# Kalshi strike_type → (bucket_type, uses floor_strike?, uses cap_strike?).
+# One dict lookup per market instead of an if/elif chain; adding a new
+# strike type later is a one-line change here.
+_STRIKE_TYPES = {
+    "greater": ("FLOOR", True,  False),   # YES if temp > floor_strike
+    "less":    ("CAP",   False, True),    # YES if temp < cap_strike
+    "between": ("RANGE", True,  True),    # YES if floor_strike <= temp <= cap_strike
+}
+
+
 def fetch_kalshi_markets(city_key):
     """
     Fetches all open temperature markets for a city from the Kalshi API.
@@ -116,57 +192,30 @@ def fetch_kalshi_markets(city_key):
 
     Returns an empty list if all API calls fail — never crashes.
     """
-    city = CITIES[city_key]
     all_markets = []
 
-    for series_type in ("HIGH", "LOW"):
-        series = city["high_series"] if series_type == "HIGH" else city["low_series"]
-
-        if series is None:
-            continue
-
+    for series_type, series in CITY_SERIES[city_key]:
         try:
-            response = requests.get(
-                f"{KALSHI_BASE_URL}/markets",
-                params={"series_ticker": series, "status": "open", "limit": 100},
-                timeout=10,
-            )
-            response.raise_for_status()
-
-            for m in response.json().get("markets", []):
+            for m in _fetch_series_markets(series):
                 strike_type = m.get("strike_type", "")
 
-                # Classify the market and read its boundary fields directly from the API.
+                # Classify the market with one table lookup (see _STRIKE_TYPES)
+                # and read its boundary fields directly from the API.
                 # We never assume bucket shape — we read whatever Kalshi actually sent.
-                if strike_type == "greater":
-                    bucket_type = "FLOOR"
-                    floor       = m.get("floor_strike")
-                    cap         = None
-                    if floor is None:
-                        log.warning(f"[{city_key}] FLOOR market missing floor_strike: {m['ticker']}")
-                        continue
-
-                elif strike_type == "less":
-                    bucket_type = "CAP"
-                    floor       = None
-                    cap         = m.get("cap_strike")
-                    if cap is None:
-                        log.warning(f"[{city_key}] CAP market missing cap_strike: {m['ticker']}")
-                        continue
-
-                elif strike_type == "between":
-                    bucket_type = "RANGE"
-                    floor       = m.get("floor_strike")
-                    cap         = m.get("cap_strike")
-                    if floor is None or cap is None:
-                        log.warning(f"[{city_key}] RANGE market missing bounds: {m['ticker']}")
-                        continue
-
-                else:
+                shape = _STRIKE_TYPES.get(strike_type)
+                if shape is None:
                     # Unknown strike type — Kalshi may add new types in the future
                     log.warning(f"[{city_key}] Unknown strike_type '{strike_type}' on {m['ticker']}")
                     continue
 
+                bucket_type, uses_floor, uses_cap = shape
+                floor = m.get("floor_strike") if uses_floor else None
+                cap   = m.get("cap_strike")   if uses_cap   else None
+
+                if (uses_floor and floor is None) or (uses_cap and cap is None):
+                    log.warning(f"[{city_key}] {bucket_type} market missing bounds: {m['ticker']}")
+                    continue
+
                 all_markets.append({
                     "ticker":       m["ticker"],
                     "event_ticker": m["event_ticker"],
@@ -189,6 +238,31 @@ def fetch_kalshi_markets(city_key):
     return all_markets
 
 
+def fetch_all_kalshi_markets(city_keys):
+    """
+    Fetches Kalshi markets for many cities at once using a small thread pool.
+
+    Each fetch_kalshi_markets() call spends almost all its time waiting on the
+    network, so running them side by side turns "sum of all request times"
+    into roughly "time of the slowest request". Every series request still
+    waits its turn on KALSHI_RATE_LIMIT, so 8 workers can't burst past the
+    shared Kalshi budget.
+
+    Returns {city_key: [market, ...]} — an empty list for any city that failed,
+    same as fetch_kalshi_markets() itself. Never crashes.
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = {city_key: pool.submit(fetch_kalshi_markets, city_key) for city_key in city_keys}
+        for city_key, future in futures.items():
+            try:
+                results[city_key] = future.result()
+            except Exception as e:
+                log.error(f"[{city_key}] Unexpected error in parallel Kalshi fetch: {e}")
+                results[city_key] = []
+    return results
+
+
 # ============================================================
 # SECTION 5 — NWS WEATHER API
 # Fetches the NWS forecast for a city and figures out the
@@ -199,7 +273,7 @@ def fetch_nws_forecast(city_key):
     """
     Fetches the NWS temperature forecast for a city using two API calls:
       1. /points/{lat},{lon}  — converts coordinates to the NWS grid office.
-                                Cached after the first call so it's only done once.
+                                Cached (on disk too) and only redone every 30 days.
       2. /gridpoints/.../forecast — returns the actual temperature periods.
 
     Returns a dict with today's and tomorrow's highs and lows:
@@ -208,6 +282,8 @@ def fetch_nws_forecast(city_key):
         "today_low":     32,
         "tomorrow_high": 55,
         "tomorrow_low":  38,
+        "today_running_high": None,   # observed so far today — filled in by
+        "today_running_low":  None,   #   fetch_city_forecasts()
     }
 
     Any value can be None if NWS doesn't have a forecast for that period yet.
@@ -215,26 +291,27 @@ def fetch_nws_forecast(city_key):
     """
     city = CITIES[city_key]
 
-    # NWS requires a User-Agent header identifying your app — requests without it may be rejected
-    headers = {"User-Agent": "KalshiClimateBot/1.0"}
-
     # --- Step 1: Look up (or load from cache) the NWS grid info for this city ---
-    if city_key not in NWS_GRID_CACHE:
+    if not _grid_entry_is_fresh(city_key):
         try:
             points_url = f"https://api.weather.gov/points/{city['lat']},{city['lon']}"
-            response = requests.get(points_url, headers=headers, timeout=10)
+            response = SESSION.get(points_url, timeout=10)
             response.raise_for_status()
 
             props = response.json()["properties"]
 
-            # Cache everything we need so we never have to call /points again this run
+            # Cache everything we need so we never have to call /points again
             NWS_GRID_CACHE[city_key] = {
                 "office":       props["gridId"],       # e.g., "OKX"
                 "grid_x":       props["gridX"],        # e.g., 33
                 "grid_y":       props["gridY"],        # e.g., 37
                 "forecast_url": props["forecast"],     # full URL for step 2
+                "lat":          city["lat"],           # coordinates this was looked up for
+                "lon":          city["lon"],
+                "cached_at":    time.time(),           # epoch seconds, for expiry
             }
             log.info(f"[{city_key}] NWS grid resolved: {props['gridId']} {props['gridX']},{props['gridY']}")
+            _save_grid_cache()
 
         except requests.exceptions.RequestException as e:
             log.error(f"[{city_key}] NWS /points lookup failed: {e}")
@@ -247,7 +324,7 @@ def fetch_nws_forecast(city_key):
 
     # --- Step 2: Fetch the forecast using the URL we got from /points ---
     try:
-        response = requests.get(grid["forecast_url"], headers=headers, timeout=10)
+        response = SESSION.get(grid["forecast_url"], timeout=10)
         response.raise_for_status()
 
         periods = response.json()["properties"]["periods"]
@@ -259,53 +336,47 @@ def fetch_nws_forecast(city_key):
         # isDaytime=True  → this is a HIGH temp period (daytime high)
         # isDaytime=False → this is a LOW temp period (overnight low)
         #
+        # Build today's and tomorrow's date strings to look up in our forecast dicts.
+        # NWS startTime dates (e.g. "2026-02-18T06:00:00-05:00") use the station's
+        # local time — effectively ET for all US cities in this bot. We must use
+        # ET-aware dates here, not datetime.now(), because on Railway (UTC clock)
+        # datetime.now() returns UTC time. After 7 PM ET, that would be tomorrow's
+        # UTC date, causing today_high/today_low to be None and today's markets
+        # to be silently skipped. Consistent with how analyze_gaps() does it.
+        et_now   = _et_now()
+        today    = et_now.strftime("%Y-%m-%d")
+        tomorrow = (et_now + timedelta(days=1)).strftime("%Y-%m-%d")
+        wanted   = (today, tomorrow)   # NWS sends ~7 days; we only use these two
+
         # We group by date (YYYY-MM-DD from startTime) to find each day's high and low.
-        forecasts = {}  # {"2026-02-18": {"high": 47, "low": 32}}
+        # Two flat dicts instead of one dict of dicts — a period goes straight
+        # into whichever one matches, no inner dict to create or check.
+        high_by_date = {}  # {"2026-02-18": 47}
+        low_by_date  = {}  # {"2026-02-18": 32}
 
         for period in periods:
             # startTime looks like "2026-02-18T06:00:00-05:00" — take just the date part
             date_str = period["startTime"][:10]
-            temp     = period["temperature"]
+            if date_str not in wanted:
+                continue   # later in the week — never looked up
+
+            temp = period["temperature"]
 
             # NWS always uses Fahrenheit for US locations, but check just in case
             if period.get("temperatureUnit") == "C":
                 temp = round(temp * 9 / 5 + 32)  # convert Celsius to Fahrenheit
 
-            if date_str not in forecasts:
-                forecasts[date_str] = {}
-
-            if period["isDaytime"]:
-                forecasts[date_str]["high"] = temp
-            else:
-                forecasts[date_str]["low"] = temp
-
-        # Build today's and tomorrow's date strings to look up in our forecasts dict.
-        # NWS startTime dates (e.g. "2026-02-18T06:00:00-05:00") use the station's
-        # local time — effectively ET for all US cities in this bot. We must use
-        # ET-aware dates here, not datetime.now(), because on Railway (UTC clock)
-        # datetime.now() returns UTC time. After 7 PM ET, that would be tomorrow's
-        # UTC date, causing today_high/today_low to be None and today's markets
-        # to be silently skipped. Consistent with how analyze_gaps() does it.
-        et_now   = datetime.now(tz=ZoneInfo("America/New_York"))
-        today    = et_now.strftime("%Y-%m-%d")
-        tomorrow = (et_now + timedelta(days=1)).strftime("%Y-%m-%d")
+            (high_by_date if period["isDaytime"] else low_by_date)[date_str] = temp
 
         result = {
-            "today_high":         forecasts.get(today,    {}).get("high"),
-            "today_low":          forecasts.get(today,    {}).get("low"),
-            "tomorrow_high":      forecasts.get(tomorrow, {}).get("high"),
-            "tomorrow_low":       forecasts.get(tomorrow, {}).get("low"),
-            "today_running_high": None,   # filled below from live observations
-            "today_running_low":  None,   # filled below from live observations
+            "today_high":         high_by_date.get(today),
+            "today_low":          low_by_date.get(today),
+            "tomorrow_high":      high_by_date.get(tomorrow),
+            "tomorrow_low":       low_by_date.get(tomorrow),
+            "today_running_high": None,   # filled in by fetch_city_forecasts()
+            "today_running_low":  None,   # filled in by fetch_city_forecasts()
         }
 
-        # Fetch actual observed running high and low for today from the station.
-        # Once the day is in progress, real observations are more accurate than
-        # a forecast issued hours earlier. Returns None if no observations exist
-        # yet (e.g. very early morning) or if the API call fails — safe to ignore.
-        result["today_running_high"] = get_current_running_high(city_key)
-        result["today_running_low"]  = get_current_running_low(city_key)
-
         return result
 
     except requests.exceptions.RequestException as e:
@@ -318,7 +389,7 @@ def fetch_nws_forecast(city_key):
 
 # ============================================================
 # SECTION 5c — MULTI-MODEL FORECASTS
-# Three additional forecast sources for cross-validation with NWS.
+# Additional forecast sources for cross-validation with NWS.
 # All are non-fatal — failure here never skips a city or blocks
 # the main cycle. NWS still drives all signal logic.
 #
@@ -327,20 +398,36 @@ def fetch_nws_forecast(city_key):
 #   Open-Meteo GFS    (gfs_seamless)   — free, no key
 #   Open-Meteo GEM    (gem_seamless)   — free, no key
 #   Open-Meteo ICON   (icon_seamless)  — free, no key
+#     (all four Open-Meteo models come back from a single request)
 #   WeatherAPI.com                     — requires WEATHERAPI_KEY
 # ============================================================
 
-def _fetch_openmeteo_model(city_key, model):
-    """
-    Shared helper for Open-Meteo model fetches.
-    Calls the Open-Meteo daily forecast API with a specific model parameter.
+# Open-Meteo models we cross-check against NWS, all fetched in one request.
+# Format: (key used in the forecast dicts, Open-Meteo model name)
+OPENMETEO_MODELS = (
+    ("ecmwf", "ecmwf_ifs025"),
+    ("gfs",   "gfs_seamless"),
+    ("gem",   "gem_seamless"),
+    ("icon",  "icon_seamless"),
+)
 
-    Returns {today_high, today_low, tomorrow_high, tomorrow_low} or None on failure.
+
+def fetch_openmeteo_forecasts(city_key):
     """
-    city = CITIES[city_key]
+    Fetches all four Open-Meteo models for a city with ONE API call.
+    Open-Meteo accepts a comma-separated "models" list and returns each
+    model's daily values under its own suffixed key, e.g.
+    "temperature_2m_max_ecmwf_ifs025" — one round trip instead of four.
+
+    Returns {"ecmwf": {...}, "gfs": {...}, "gem": {...}, "icon": {...}} where
+    each value is {today_high, today_low, tomorrow_high, tomorrow_low} or None
+    if that model (or the whole request) failed. Never crashes.
+    """
+    city    = CITIES[city_key]
+    results = {key: None for key, _ in OPENMETEO_MODELS}
 
     try:
-        response = requests.get(
+        response = SESSION.get(
             "https://api.open-meteo.com/v1/forecast",
             params={
                 "latitude":         city["lat"],
@@ -349,64 +436,50 @@ def _fetch_openmeteo_model(city_key, model):
                 "temperature_unit": "fahrenheit",
                 "timezone":         "auto",
                 "forecast_days":    2,
-                "models":           model,
+                "models":           ",".join(model for _, model in OPENMETEO_MODELS),
             },
             timeout=10,
         )
         response.raise_for_status()
-        data = response.json()
-
-        times = data["daily"]["time"]
-        highs = data["daily"]["temperature_2m_max"]
-        lows  = data["daily"]["temperature_2m_min"]
-
-        # Take the first date as "today" and the second as "tomorrow".
-        # Open-Meteo uses timezone=auto (station's local time), so its day
-        # boundaries always match the station's local date — no UTC offset
-        # arithmetic needed, and no risk of a None result after 7 PM ET.
-        result = {"today_high": None, "today_low": None, "tomorrow_high": None, "tomorrow_low": None}
-
-        if len(times) >= 1:
-            result["today_high"] = round(highs[0]) if highs[0] is not None else None
-            result["today_low"]  = round(lows[0])  if lows[0]  is not None else None
-
-        if len(times) >= 2:
-            result["tomorrow_high"] = round(highs[1]) if highs[1] is not None else None
-            result["tomorrow_low"]  = round(lows[1])  if lows[1]  is not None else None
-
-        log.info(
-            f"[{city_key}] Open-Meteo ({model}): "
-            f"today {result['today_high']}°F/{result['today_low']}°F, "
-            f"tomorrow {result['tomorrow_high']}°F/{result['tomorrow_low']}°F"
-        )
-        return result
-
+        daily = response.json()["daily"]
+        times = daily["time"]
     except requests.exceptions.RequestException as e:
-        log.error(f"[{city_key}] Open-Meteo ({model}) request failed: {e}")
-        return None
+        log.error(f"[{city_key}] Open-Meteo request failed: {e}")
+        return results
     except Exception as e:
-        log.error(f"[{city_key}] Unexpected error in Open-Meteo ({model}) fetch: {e}")
-        return None
-
-
-def fetch_ecmwf_forecast(city_key):
-    """Fetches the ECMWF IFS 0.25° model forecast from Open-Meteo. Free, no key needed."""
-    return _fetch_openmeteo_model(city_key, "ecmwf_ifs025")
-
-
-def fetch_gfs_forecast(city_key):
-    """Fetches the GFS Seamless model forecast from Open-Meteo. Free, no key needed."""
-    return _fetch_openmeteo_model(city_key, "gfs_seamless")
-
+        log.error(f"[{city_key}] Unexpected error in Open-Meteo fetch: {e}")
+        return results
 
-def fetch_gem_forecast(city_key):
-    """Fetches the Canadian GEM Seamless model forecast from Open-Meteo. Free, no key needed."""
-    return _fetch_openmeteo_model(city_key, "gem_seamless")
+    for key, model in OPENMETEO_MODELS:
+        try:
+            highs = daily[f"temperature_2m_max_{model}"]
+            lows  = daily[f"temperature_2m_min_{model}"]
+
+            # Take the first date as "today" and the second as "tomorrow".
+            # Open-Meteo uses timezone=auto (station's local time), so its day
+            # boundaries always match the station's local date — no UTC offset
+            # arithmetic needed, and no risk of a None result after 7 PM ET.
+            result = {"today_high": None, "today_low": None, "tomorrow_high": None, "tomorrow_low": None}
+
+            if len(times) >= 1:
+                result["today_high"] = round(highs[0]) if highs[0] is not None else None
+                result["today_low"]  = round(lows[0])  if lows[0]  is not None else None
+
+            if len(times) >= 2:
+                result["tomorrow_high"] = round(highs[1]) if highs[1] is not None else None
+                result["tomorrow_low"]  = round(lows[1])  if lows[1]  is not None else None
+
+            log.info(
+                f"[{city_key}] Open-Meteo ({model}): "
+                f"today {result['today_high']}°F/{result['today_low']}°F, "
+                f"tomorrow {result['tomorrow_high']}°F/{result['tomorrow_low']}°F"
+            )
+            results[key] = result
 
+        except Exception as e:
+            log.error(f"[{city_key}] Unexpected error parsing Open-Meteo ({model}): {e}")
 
-def fetch_icon_forecast(city_key):
-    """Fetches the DWD ICON Seamless model forecast from Open-Meteo. Free, no key needed."""
-    return _fetch_openmeteo_model(city_key, "icon_seamless")
+    return results
 
 
 def fetch_hourly_forecast(city_key):
@@ -421,7 +494,7 @@ def fetch_hourly_forecast(city_key):
     city = CITIES[city_key]
 
     try:
-        response = requests.get(
+        response = SESSION.get(
             "https://api.open-meteo.com/v1/forecast",
             params={
                 "latitude":         city["lat"],
@@ -468,7 +541,7 @@ def fetch_weatherapi_forecast(city_key):
     city = CITIES[city_key]
 
     try:
-        response = requests.get(
+        response = SESSION.get(
             "https://api.weatherapi.com/v1/forecast.json",
             params={
                 "key":    WEATHERAPI_KEY,
@@ -505,3 +578,105 @@ def fetch_weatherapi_forecast(city_key):
     except Exception as e:
         log.error(f"[{city_key}] Unexpected error in WeatherAPI fetch: {e}")
         return None
+
+
+# ============================================================
+# SECTION 5d — ALL FORECASTS FOR ONE CITY
+# ============================================================
+
+# Forecast sources fetched for every city, in the order they're submitted.
+# Format: (key in the returned dict, fetch function)
+# "openmeteo" returns all four Open-Meteo models at once and is unpacked
+# into "ecmwf" / "gfs" / "gem" / "icon" below.
+_FORECAST_FETCHERS = (
+    ("nws",        fetch_nws_forecast),
+    ("openmeteo",  fetch_openmeteo_forecasts),
+    ("weatherapi", fetch_weatherapi_forecast),
+    ("hourly",     fetch_hourly_forecast),
+    ("running",    get_current_running_extremes),   # merged into "nws" below
+)
+
+
+# Short-lived cache for the slow-moving model forecasts (Open-Meteo, WeatherAPI,
+# hourly). These only update every hour or so, so re-fetching them every
+# 10-minute cycle mostly downloads the same numbers again.
+# Format: {("openmeteo", "NYC"): ("2026-02-18T14", fetched_at_monotonic, result)}
+# NWS and the live running high/low observations aren't cached here.
+FORECAST_CACHE_SECONDS = 30 * 60
+_FORECAST_CACHE   = {}
+_CACHED_FORECASTS = {"openmeteo", "weatherapi", "hourly"}
+
+
+def _cached_fetch(key, fetch, city_key):
+    """
+    Calls fetch(city_key), reusing the last result for up to
+    FORECAST_CACHE_SECONDS. Entries are also tied to the current UTC hour:
+    every US local midnight falls on a UTC hour boundary, so a cached
+    "today"/"tomorrow" pair can never be reused after the city's date rolls over.
+
+    Failed fetches (None, or a batched result with any model missing) are
+    not cached, so the next cycle tries again.
+    """
+    utc_hour = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H")
+    now      = time.monotonic()
+
+    cached = _FORECAST_CACHE.get((key, city_key))
+    if cached is not None:
+        cached_hour, fetched_at, result = cached
+        if cached_hour == utc_hour and now - fetched_at < FORECAST_CACHE_SECONDS:
+            return result
+
+    result = fetch(city_key)
+
+    # Don't pin a failure: skip None, and skip a batched Open-Meteo result
+    # where any one model came back empty.
+    failed = result is None or (key == "openmeteo" and None in result.values())
+    if not failed:
+        _FORECAST_CACHE[(key, city_key)] = (utc_hour, now, result)
+    return result
+
+
+def fetch_city_forecasts(city_key):
+    """
+    Fetches every forecast source for one city at the same time.
+
+    The NWS forecast, NWS observations, Open-Meteo and WeatherAPI calls don't
+    depend on each other and spend almost all their time waiting on the
+    network, so running them side by side makes the city take about as long
+    as its slowest source instead of the sum of all of them. The observed
+    running high/low is merged into the "nws" entry. Open-Meteo, WeatherAPI and hourly results are
+    reused for up to FORECAST_CACHE_SECONDS (see _cached_fetch).
+
+    Returns {"nws": {...}, "ecmwf": {...}, "gfs": {...}, "gem": {...},
+             "icon": {...}, "weatherapi": {...}, "hourly": {...}}.
+    Any value can be None — same as calling each fetcher on its own. Never crashes.
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(_FORECAST_FETCHERS)) as pool:
+        futures = {
+            key: (pool.submit(_cached_fetch, key, fetch, city_key) if key in _CACHED_FORECASTS
+                  else pool.submit(fetch, city_key))
+            for key, fetch in _FORECAST_FETCHERS
+        }
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                log.error(f"[{city_key}] Unexpected error in parallel {key} fetch: {e}")
+                results[key] = None
+
+    # Actual observed running high and low for today from the station, added
+    # to the NWS result. Once the day is in progress, real observations are
+    # more accurate than a forecast issued hours earlier. Each side is None if
+    # no observations exist yet (e.g. very early morning) or the call failed.
+    running = results.pop("running") or {}
+    if results["nws"] is not None:
+        results["nws"]["today_running_high"] = running.get("high")
+        results["nws"]["today_running_low"]  = running.get("low")
+
+    # Unpack the batched Open-Meteo result into one entry per model
+    openmeteo = results.pop("openmeteo") or {}
+    for key, _ in OPENMETEO_MODELS:
+        results[key] = openmeteo.get(key)
+
+    return results
@@ -11,24 +11,99 @@ issued hours earlier.
 
 import math
 import requests
-from datetime import datetime, timedelta
-from config import CITIES, log
+from datetime import datetime, timedelta, timezone
+from config import CITIES, SESSION, log
+
+
+# Midnight LST (as the UTC string the NWS API wants) only changes once a day
+# per city, so it's built once per LST date and reused every cycle after.
+# Format: {"NYC": (date(2026, 2, 18), "2026-02-18T05:00:00Z")}
+_LST_MIDNIGHT_CACHE = {}
+
+
+def _lst_midnight_utc_str(city_key):
+    """
+    Returns midnight LST today for this city as an ISO 8601 UTC string,
+    e.g. "2026-02-18T05:00:00Z" for NYC (EST = UTC-5).
+
+    "LST now" = UTC now shifted by the station's standard (non-DST) offset.
+    Example: it's 14:00 UTC on Feb 18. EST = UTC-5 → LST now = 09:00 Feb 18.
+    Midnight EST today = 00:00 Feb 18 EST = 05:00 UTC Feb 18.
+    """
+    lst_offset = CITIES[city_key]["lst_utc_offset"]   # standard time offset, e.g. -5 for EST
+    now_lst    = datetime.now(timezone.utc) + timedelta(hours=lst_offset)  # shift UTC → LST
+    lst_date   = now_lst.date()
+
+    cached = _LST_MIDNIGHT_CACHE.get(city_key)
+    if cached is not None and cached[0] == lst_date:
+        return cached[1]
+
+    # Midnight in LST for the current LST date
+    lst_midnight = now_lst.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    # Convert that LST midnight back to UTC for the API query
+    # (subtract the offset, because LST = UTC + offset → UTC = LST - offset)
+    utc_midnight = lst_midnight - timedelta(hours=lst_offset)
+
+    # Format as ISO 8601 with Z suffix (NWS API requires this format)
+    start_utc_str = utc_midnight.strftime("%Y-%m-%dT%H:%M:%SZ")
+    _LST_MIDNIGHT_CACHE[city_key] = (lst_date, start_utc_str)
+    return start_utc_str
+
+
+# Last observations result per city, for conditional requests. Between two
+# cycles the station has often posted nothing new, so we send the
+# Last-Modified time NWS gave us last time as If-Modified-Since; a
+# 304 Not Modified reply has no body and we reuse the stored result.
+# Only valid for the same query (same midnight-LST start).
+# Format: {"NYC": ("2026-02-18T05:00:00Z", "Wed, 18 Feb 2026 15:51:00 GMT", {"high": {...}, "low": {...}})}
+_OBS_RESULT_CACHE = {}
+
+
+def _asos_fahrenheit(celsius):
+    """
+    Converts one ASOS Celsius reading to official °F, returning
+    (conservative, upper_bound, lower_bound):
+
+        conservative = floor(C × 9/5 + 32)
+        upper_bound  = floor((C + 0.05) × 9/5 + 32)
+        lower_bound  = floor((C - 0.05) × 9/5 + 32)
+
+    ASOS readings come in whole tenths of a degree, so we count in
+    half-tenths instead (h = C × 20, always a whole number). Multiplying the
+    formula through by 100 gives  100 × °F = 9h + 3200,  and ±0.05°C is just
+    h ± 1 — pure integer math, no float rounding right at a floor() boundary.
+    A value that isn't a whole tenth (shouldn't happen) falls back to the
+    float formulas above.
+    """
+    tenths = round(celsius * 10)
+    if abs(celsius * 10 - tenths) > 1e-6:
+        return (
+            math.floor(celsius * 9 / 5 + 32),
+            math.floor((celsius + 0.05) * 9 / 5 + 32),
+            math.floor((celsius - 0.05) * 9 / 5 + 32),
+        )
+    h = 2 * tenths
+    return (9 * h + 3200) // 100, (9 * h + 3209) // 100, (9 * h + 3191) // 100
 
 
 # ============================================================
-# SECTION 5b — RUNNING HIGH FROM OBSERVATIONS
+# SECTION 5b — RUNNING HIGH AND LOW FROM OBSERVATIONS
 # Fetches actual observed temperatures from NWS since midnight
-# LST and returns the highest value seen so far today.
-# Used in place of the grid forecast for TODAY's HIGH markets.
+# LST and returns the highest and lowest values seen so far today.
+# Used in place of the grid forecast for TODAY's HIGH and LOW
+# markets. Both come from a single API call and a single pass
+# over the readings.
 # ============================================================
 
-def get_current_running_high(city_key):
+def get_current_running_extremes(city_key):
     """
     Fetches today's actual observed temperature readings from the NWS
-    observations API and returns the highest value recorded since midnight LST.
+    observations API ONCE and returns both the running high and the running
+    low recorded since midnight LST.
 
-    This replaces the NWS grid forecast for TODAY's HIGH markets because once
-    the day is in progress, real observations are more accurate than a forecast
+    These replace the NWS grid forecast for TODAY's markets because once the
+    day is in progress, real observations are more accurate than a forecast
     that may have been issued many hours ago.
 
     --- WHY LST, NOT CIVIL TIME ---
@@ -53,97 +128,104 @@ def get_current_running_high(city_key):
 
     NWS stores Celsius to one decimal place, so each reading carries up to
     ±0.05°C of precision uncertainty. This translates to up to ±0.09°F —
-    usually zero, but occasionally 1°F at a floor() boundary. We track two
-    values per reading:
+    usually zero, but occasionally 1°F at a floor() boundary. We track:
 
-        max_observed  = max of floor(C × 9/5 + 32)           — conservative
+        max_observed  = max of floor(C × 9/5 + 32)            — conservative
         probable_max  = max of floor((C + 0.05) × 9/5 + 32)  — upper bound
+        min_observed  = min of floor(C × 9/5 + 32)            — conservative
+        probable_min  = min of floor((C - 0.05) × 9/5 + 32)  — lower bound
 
     For cooperative observer (hourly) stations like KNYC, temperatures are
     observed and recorded in whole Fahrenheit degrees. The NWS API still
     returns them as Celsius, so we convert back but use round() instead of
-    floor() since the original value was already a whole °F.
+    floor() since the original value was already a whole °F — no rounding
+    ambiguity (probable_max == max_observed, probable_min == min_observed).
 
-    --- DSM HIGH ---
+    --- DSM HIGH (high only) ---
     ASOS stations broadcast a Daily Summary Message (DSM) roughly once per
     hour containing maxTemperatureLast24Hours. This is the official rolling
     maximum and is the most authoritative value available. If it exceeds what
     we compute from individual readings (e.g. due to gaps in the time series),
-    we use the DSM value as the floor for our result.
+    we use the DSM value as the floor for the running high. There is no
+    minTemperatureLast24Hours field, so the running low comes from the
+    observed readings alone.
 
     Returns:
-      {"max_observed": int, "probable_max": int, "obs_count": int}
-        on success (at least one valid reading found)
-      None  if no readings exist yet or the API call fails.
+      {"high": {"max_observed": int, "probable_max": int, "obs_count": int} or None,
+       "low":  {"min_observed": int, "probable_min": int, "obs_count": int} or None}
+      Either side is None if no readings exist yet or the API call fails.
     """
     city         = CITIES[city_key]
     station      = city["nws_station"]
     station_type = city["station_type"]
     lst_offset   = city["lst_utc_offset"]   # standard time offset, e.g. -5 for EST
-
-    headers = {"User-Agent": "KalshiClimateBot/1.0"}
+    empty        = {"high": None, "low": None}
 
     # ── Step 1: Find midnight LST in UTC ────────────────────────────────────
     # We want all observations from 00:00 LST today onward.
-    # "LST now" = UTC now shifted by the station's standard (non-DST) offset.
-    # Example: it's 14:00 UTC on Feb 18. EST = UTC-5 → LST now = 09:00 Feb 18.
-    # Midnight EST today = 00:00 Feb 18 EST = 05:00 UTC Feb 18.
-    now_utc  = datetime.utcnow()
-    now_lst  = now_utc + timedelta(hours=lst_offset)  # shift UTC → LST
-
-    # Midnight in LST for the current LST date
-    lst_midnight = now_lst.replace(hour=0, minute=0, second=0, microsecond=0)
-
-    # Convert that LST midnight back to UTC for the API query
-    # (subtract the offset, because LST = UTC + offset → UTC = LST - offset)
-    utc_midnight = lst_midnight - timedelta(hours=lst_offset)
-
-    # Format as ISO 8601 with Z suffix (NWS API requires this format)
-    start_utc_str = utc_midnight.strftime("%Y-%m-%dT%H:%M:%SZ")
+    # (Computed once per LST day — see _lst_midnight_utc_str.)
+    start_utc_str = _lst_midnight_utc_str(city_key)
 
     log.info(
-        f"[{city_key}] Running high: querying {station} obs since "
+        f"[{city_key}] Running high/low: querying {station} obs since "
         f"{start_utc_str} UTC (= midnight LST, offset {lst_offset:+d}h)"
     )
 
+    # Ask NWS to skip the body if nothing changed since our last identical query
+    cached  = _OBS_RESULT_CACHE.get(city_key)
+    headers = {}
+    if cached is not None and cached[0] == start_utc_str:
+        headers["If-Modified-Since"] = cached[1]
+
     try:
-        response = requests.get(
+        response = SESSION.get(
             f"https://api.weather.gov/stations/{station}/observations",
             params={"start": start_utc_str, "limit": 500},
             headers=headers,
             timeout=15,
         )
+        if response.status_code == 304:
+            log.info(f"[{city_key}] Observations unchanged since last cycle — reusing result.")
+            return cached[2]
         response.raise_for_status()
-        features = response.json().get("features", [])
+        last_modified = response.headers.get("Last-Modified")
+        features      = response.json().get("features", [])
 
         if not features:
             log.info(f"[{city_key}] No observations found since midnight LST.")
-            return None
+            return empty
 
-        max_observed = None   # conservative max: floor(C × 9/5 + 32) for 5-min stations
-        probable_max = None   # upper bound: floor((C + 0.05) × 9/5 + 32)
-        dsm_high     = None   # Daily Summary Message high from maxTemperatureLast24Hours
-        valid_count  = 0      # number of observations with a valid temperature reading
+        # Per-reading °F values, collected first and reduced with the builtin
+        # max()/min() after the loop (one C-level pass each, instead of four
+        # compare-and-update branches per reading).
+        conservatives = []   # floor(C × 9/5 + 32) for 5-min stations
+        upper_bounds  = []   # floor((C + 0.05) × 9/5 + 32)
+        lower_bounds  = []   # floor((C - 0.05) × 9/5 + 32)
+        dsm_readings  = []   # Daily Summary Message highs from maxTemperatureLast24Hours
+
+        # Station type is fixed per city — decide the rounding rule once,
+        # not once per reading.
+        is_asos = station_type == "5-minute"
 
         for feature in features:
-            props = feature.get("properties", {})
+            # .get() without a {} default: the checks below already treat a
+            # missing field as "no reading", and a throwaway empty dict per
+            # field per feature adds up over a few hundred observations.
+            props = feature.get("properties") or {}
 
             # ── Check for DSM high ───────────────────────────────────────────
             # ASOS stations include maxTemperatureLast24Hours in their hourly
             # DSM broadcast. This is the most authoritative daily high value —
             # it's what Kalshi ultimately compares against for resolution.
             # Not every observation has it; we take the max across all that do.
-            dsm_obj = props.get("maxTemperatureLast24Hours", {})
+            # (No DSM min field exists in the NWS observations API.)
+            dsm_obj = props.get("maxTemperatureLast24Hours")
             if dsm_obj and dsm_obj.get("value") is not None:
                 # NWS always returns this in Celsius
-                dsm_c = dsm_obj["value"]
-                dsm_f = math.floor(dsm_c * 9 / 5 + 32)
-                if dsm_high is None or dsm_f > dsm_high:
-                    dsm_high = dsm_f
-                    log.debug(f"[{city_key}] DSM high reading: {dsm_c}°C → {dsm_f}°F")
+                dsm_readings.append(math.floor(dsm_obj["value"] * 9 / 5 + 32))
 
             # ── Read the individual temperature observation ──────────────────
-            temp_obj = props.get("temperature", {})
+            temp_obj = props.get("temperature")
             if not temp_obj or temp_obj.get("value") is None:
                 # Observation exists but has no temperature (e.g. a SPECI report
                 # with only wind/pressure data). Skip it.
@@ -161,16 +243,17 @@ def get_current_running_high(city_key):
             else:
                 celsius = raw_value   # already °C
 
-            if station_type == "5-minute":
+            if is_asos:
                 # ── ASOS 5-minute station ────────────────────────────────────
                 # Official °F = floor(C × 9/5 + 32). The raw Celsius is stored
                 # to 0.1°C precision, so the true value could be up to 0.05°C
-                # higher than what's reported (rounding uncertainty). We track:
+                # higher or lower than what's reported. We track:
                 #   conservative: floor(C × 9/5 + 32)
-                #   upper_bound:  floor((C + 0.05) × 9/5 + 32)
-                # The difference is 0 or 1°F depending on where the floor falls.
-                conservative = math.floor(celsius * 9 / 5 + 32)
-                upper_bound  = math.floor((celsius + 0.05) * 9 / 5 + 32)
+                #   upper_bound:  floor((C + 0.05) × 9/5 + 32)   (for the high)
+                #   lower_bound:  floor((C - 0.05) × 9/5 + 32)   (for the low)
+                # Each bound differs from conservative by 0 or 1°F depending on
+                # where the floor falls. (Integer math — see _asos_fahrenheit.)
+                conservative, upper_bound, lower_bound = _asos_fahrenheit(celsius)
 
             else:
                 # ── Cooperative observer (hourly) station, e.g. KNYC ─────────
@@ -180,14 +263,23 @@ def get_current_running_high(city_key):
                 # whole °F reading. No floor() rounding uncertainty applies.
                 conservative = round(celsius * 9 / 5 + 32)
                 upper_bound  = conservative   # no ambiguity for hourly stations
+                lower_bound  = conservative
 
-            # Update rolling maximums
-            if max_observed is None or conservative > max_observed:
-                max_observed = conservative
-            if probable_max is None or upper_bound > probable_max:
-                probable_max = upper_bound
+            conservatives.append(conservative)
+            upper_bounds.append(upper_bound)
+            lower_bounds.append(lower_bound)
 
-            valid_count += 1
+        # ── Reduce to the running extremes ───────────────────────────────────
+        valid_count = len(conservatives)   # observations with a valid temperature reading
+        dsm_high    = max(dsm_readings) if dsm_readings else None
+
+        if conservatives:
+            max_observed = max(conservatives)   # conservative max
+            probable_max = max(upper_bounds)    # upper bound
+            min_observed = min(conservatives)   # conservative min
+            probable_min = min(lower_bounds)    # lower bound
+        else:
+            max_observed = probable_max = min_observed = probable_min = None
 
         # ── Incorporate the DSM high ─────────────────────────────────────────
         # If the DSM high exceeds our computed max (which can happen if the
@@ -200,184 +292,43 @@ def get_current_running_high(city_key):
             if probable_max is None or dsm_high > probable_max:
                 probable_max = dsm_high
 
-        if max_observed is None:
+        result = {"high": None, "low": None}
+
+        if max_observed is not None:
+            log.info(
+                f"[{city_key}] Running high: {max_observed}°F "
+                f"(probable_max: {probable_max}°F, DSM: {dsm_high}°F, "
+                f"{valid_count} valid readings from {len(features)} obs)"
+            )
+            result["high"] = {
+                "max_observed": max_observed,   # conservative official high so far today
+                "probable_max": probable_max,   # upper bound accounting for C→F rounding
+                "obs_count":    valid_count,    # number of individual readings processed
+            }
+
+        if min_observed is not None:
+            log.info(
+                f"[{city_key}] Running low: {min_observed}°F "
+                f"(probable_min: {probable_min}°F, "
+                f"{valid_count} valid readings from {len(features)} obs)"
+            )
+            result["low"] = {
+                "min_observed": min_observed,   # conservative official low so far today
+                "probable_min": probable_min,   # lower bound accounting for C→F rounding
+                "obs_count":    valid_count,    # number of individual readings processed
+            }
+        else:
             log.info(f"[{city_key}] {len(features)} observations found but none had temperature data.")
-            return None
-
-        log.info(
-            f"[{city_key}] Running high: {max_observed}°F "
-            f"(probable_max: {probable_max}°F, DSM: {dsm_high}°F, "
-            f"{valid_count} valid readings from {len(features)} obs)"
-        )
-        return {
-            "max_observed": max_observed,   # conservative official high so far today
-            "probable_max": probable_max,   # upper bound accounting for C→F rounding
-            "obs_count":    valid_count,    # number of individual readings processed
-        }
-
-    except requests.exceptions.RequestException as e:
-        log.error(f"[{city_key}] Running high fetch failed: {e}")
-        return None
-    except Exception as e:
-        log.error(f"[{city_key}] Unexpected error in running high fetch: {e}")
-        return None
 
+        # Remember this result for the next cycle's conditional request
+        if last_modified:
+            _OBS_RESULT_CACHE[city_key] = (start_utc_str, last_modified, result)
 
-# ============================================================
-# SECTION 5b-LOW — RUNNING LOW FROM OBSERVATIONS
-# Mirror image of get_current_running_high() for LOW markets.
-# Fetches actual observed temperatures from NWS since midnight
-# LST and returns the lowest value seen so far today.
-# Used in place of the grid forecast for TODAY's LOW markets.
-#
-# Key differences from get_current_running_high():
-#   - Tracks running minimum instead of maximum
-#   - No DSM field: there is no minTemperatureLast24Hours in the
-#     NWS observations API, so that section is omitted entirely
-#   - probable_min uses floor((C - 0.05) × 9/5 + 32) as the lower
-#     bound — the stored Celsius could be 0.05°C higher than true,
-#     meaning the true converted minimum might be 1°F lower
-# ============================================================
-
-def get_current_running_low(city_key):
-    """
-    Fetches today's actual observed temperature readings from the NWS
-    observations API and returns the lowest value recorded since midnight LST.
-
-    This replaces the NWS grid forecast for TODAY's LOW markets because once
-    the day is in progress, real observations are more accurate than a forecast
-    that may have been issued many hours ago.
-
-    Uses the same LST midnight calculation as get_current_running_high() —
-    see that function's docstring for the full explanation of why we use LST
-    rather than civil time (short version: Kalshi resolves on LST windows,
-    not civil-time midnight, so a summer ET city still uses UTC-5, not UTC-4).
-
-    --- CELSIUS ROUNDING LOGIC (5-minute ASOS stations) ---
-    ASOS stations store temperature in Celsius to 0.1°C precision.
-    Official °F = floor(C × 9/5 + 32). A stored value of, say, 10.0°C
-    represents the range [9.95, 10.05)°C — the true temperature could be
-    up to 0.05°C lower. We track two values:
-
-        min_observed  = min of floor(C × 9/5 + 32)            — conservative
-        probable_min  = min of floor((C - 0.05) × 9/5 + 32)  — lower bound
-
-    For cooperative observer (hourly) stations the original reading was a
-    whole °F, so round() recovers it exactly and there is no lower-bound
-    ambiguity (probable_min == min_observed).
-
-    --- NO DSM EQUIVALENT ---
-    ASOS DSM broadcasts include maxTemperatureLast24Hours but NOT a
-    minTemperatureLast24Hours field, so we cannot apply the same DSM
-    override that get_current_running_high() uses. The observed readings
-    from the time series are the only source for the running low.
-
-    Returns:
-      {"min_observed": int, "probable_min": int, "obs_count": int}
-        on success (at least one valid reading found)
-      None  if no readings exist yet or the API call fails.
-    """
-    city         = CITIES[city_key]
-    station      = city["nws_station"]
-    station_type = city["station_type"]
-    lst_offset   = city["lst_utc_offset"]   # standard time offset, e.g. -5 for EST
-
-    headers = {"User-Agent": "KalshiClimateBot/1.0"}
-
-    # ── Step 1: Find midnight LST in UTC (identical to running high) ─────────
-    now_utc      = datetime.utcnow()
-    now_lst      = now_utc + timedelta(hours=lst_offset)
-    lst_midnight = now_lst.replace(hour=0, minute=0, second=0, microsecond=0)
-    utc_midnight = lst_midnight - timedelta(hours=lst_offset)
-    start_utc_str = utc_midnight.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-    log.info(
-        f"[{city_key}] Running low: querying {station} obs since "
-        f"{start_utc_str} UTC (= midnight LST, offset {lst_offset:+d}h)"
-    )
-
-    try:
-        response = requests.get(
-            f"https://api.weather.gov/stations/{station}/observations",
-            params={"start": start_utc_str, "limit": 500},
-            headers=headers,
-            timeout=15,
-        )
-        response.raise_for_status()
-        features = response.json().get("features", [])
-
-        if not features:
-            log.info(f"[{city_key}] No observations found since midnight LST.")
-            return None
-
-        min_observed = None   # conservative min: floor(C × 9/5 + 32) for 5-min stations
-        probable_min = None   # lower bound: floor((C - 0.05) × 9/5 + 32)
-        valid_count  = 0      # number of observations with a valid temperature reading
-
-        for feature in features:
-            props = feature.get("properties", {})
-
-            # ── Read the individual temperature observation ──────────────────
-            # (No DSM min field exists in the NWS observations API — skip.)
-            temp_obj = props.get("temperature", {})
-            if not temp_obj or temp_obj.get("value") is None:
-                # Observation exists but has no temperature (e.g. a SPECI report
-                # with only wind/pressure data). Skip it.
-                continue
-
-            raw_value = temp_obj["value"]
-            unit_code = temp_obj.get("unitCode", "")
-
-            # The NWS API always returns temperature in Celsius (wmoUnit:degC),
-            # but we guard against surprises just in case.
-            if "degF" in unit_code:
-                celsius = (raw_value - 32) * 5 / 9
-            else:
-                celsius = raw_value   # already °C
-
-            if station_type == "5-minute":
-                # ── ASOS 5-minute station ────────────────────────────────────
-                # Official °F = floor(C × 9/5 + 32). The stored Celsius could
-                # be up to 0.05°C higher than the true value (precision limit),
-                # meaning the true minimum might be 1°F lower. We track:
-                #   conservative: floor(C × 9/5 + 32)
-                #   lower_bound:  floor((C - 0.05) × 9/5 + 32)
-                conservative = math.floor(celsius * 9 / 5 + 32)
-                lower_bound  = math.floor((celsius - 0.05) * 9 / 5 + 32)
-
-            else:
-                # ── Cooperative observer (hourly) station, e.g. KNYC ─────────
-                # Original whole °F reading; round() recovers it exactly.
-                # No lower-bound ambiguity applies.
-                conservative = round(celsius * 9 / 5 + 32)
-                lower_bound  = conservative
-
-            # Update rolling minimums
-            if min_observed is None or conservative < min_observed:
-                min_observed = conservative
-            if probable_min is None or lower_bound < probable_min:
-                probable_min = lower_bound
-
-            valid_count += 1
-
-        if min_observed is None:
-            log.info(f"[{city_key}] {len(features)} observations found but none had temperature data.")
-            return None
-
-        log.info(
-            f"[{city_key}] Running low: {min_observed}°F "
-            f"(probable_min: {probable_min}°F, "
-            f"{valid_count} valid readings from {len(features)} obs)"
-        )
-        return {
-            "min_observed": min_observed,   # conservative official low so far today
-            "probable_min": probable_min,   # lower bound accounting for C→F rounding
-            "obs_count":    valid_count,    # number of individual readings processed
-        }
+        return result
 
     except requests.exceptions.RequestException as e:
-        log.error(f"[{city_key}] Running low fetch failed: {e}")
-        return None
+        log.error(f"[{city_key}] Running high/low fetch failed: {e}")
+        return empty
     except Exception as e:
-        log.error(f"[{city_key}] Unexpected error in running low fetch: {e}")
-        return None
+        log.error(f"[{city_key}] Unexpected error in running high/low fetch: {e}")
+        return empty
@@ -11,10 +11,9 @@ open positions are lost. Resolved trades are written to paper_trades.csv.
 
 import os
 import csv
-import time
-import requests
 from datetime import datetime
-from config import CITIES, KALSHI_BASE_URL, log
+from concurrent.futures import ThreadPoolExecutor
+from config import CITIES, KALSHI_BASE_URL, KALSHI_RATE_LIMIT, SESSION, log, _et_now, _ticker_market_date
 from analysis import _get_model_data
 from alerts import _passes_paper_trade_filters
 
@@ -31,6 +30,10 @@ PAPER_TRADE_LOG = os.getenv("PAPER_TRADE_LOG_PATH", "paper_trades.csv")
 _PAPER_POSITIONS = {}
 _PAPER_TRADE_DATE = None   # ET date; used to detect day rollover
 
+# True once PAPER_TRADE_LOG is known to have its header row. None = not
+# checked yet (first write after startup) — same idea as logging_csv.py.
+_PAPER_LOG_HAS_HEADER = None
+
 PAPER_TRADE_FIELDNAMES = [
     "entry_time", "exit_time", "city", "market_type", "bucket_label", "ticker",
     "direction", "entry_price", "exit_result", "pnl_cents",
@@ -54,6 +57,8 @@ def check_paper_entries(all_results, all_forecasts):
     because we need live observations to confirm the signal is real.
     """
     for city_key, gaps in all_results.items():
+        city_name = CITIES[city_key]["name"]   # same for every market in this city
+
         for g in gaps:
             # Trade both today and tomorrow markets.
             # Tomorrow markets are entered at whatever price is current when the
@@ -77,7 +82,7 @@ def check_paper_entries(all_results, all_forecasts):
             # Record the entry in memory
             _PAPER_POSITIONS[ticker] = {
                 "entry_time":               datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "city":                     CITIES[city_key]["name"],
+                "city":                     city_name,
                 "market_type":              g["series_type"],
                 "bucket_label":             g["bucket_label"],
                 "ticker":                   ticker,
@@ -98,6 +103,22 @@ def check_paper_entries(all_results, all_forecasts):
             )
 
 
+def _fetch_paper_result(ticker):
+    """
+    Looks up one market on Kalshi and returns its result string
+    ("yes", "no", or "" / other if not resolved yet).
+    Raises on network errors — resolve_paper_trades() logs them per ticker.
+    """
+    KALSHI_RATE_LIMIT.acquire()   # shared Kalshi budget — see config.py
+    response = SESSION.get(
+        f"{KALSHI_BASE_URL}/markets/{ticker}",
+        timeout=10,
+    )
+    data   = response.json()   # parse the body once
+    market = data.get("market", data)
+    return market.get("result", "")
+
+
 def resolve_paper_trades():
     """
     Checks each open paper position against the Kalshi API to see if
@@ -108,23 +129,39 @@ def resolve_paper_trades():
       BUY YES: win = +(100 - entry_price), loss = -entry_price
       BUY NO:  win = +entry_price,          loss = -(100 - entry_price)
     """
+    global _PAPER_LOG_HAS_HEADER
+
     if not _PAPER_POSITIONS:
         return
 
     resolved_tickers = []
-
-    for ticker, pos in list(_PAPER_POSITIONS.items()):
+    out_rows         = []   # CSV rows for resolved positions, written once at the end
+    exit_time        = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    # A market can't settle until its day is over in the city's local
+    # standard time, which is always at or after midnight ET. So any position
+    # whose ticker date is today (ET) or later is known to be unresolved —
+    # skip the API call and leave it open for a later cycle. Tickers that
+    # don't parse are always checked.
+    today_et  = _et_now().date()
+    positions = []
+    for ticker, pos in _PAPER_POSITIONS.items():
+        market_date = _ticker_market_date(ticker)
+        if market_date is None or market_date < today_et:
+            positions.append((ticker, pos))
+
+    # Check the remaining positions on Kalshi at the same time — each check is
+    # one HTTP round trip, so 4 workers cut the wait to roughly a quarter.
+    # Results are then processed below in the original position order.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = {ticker: pool.submit(_fetch_paper_result, ticker) for ticker, _ in positions}
+
+    for ticker, pos in positions:
         try:
-            response = requests.get(
-                f"{KALSHI_BASE_URL}/markets/{ticker}",
-                timeout=10,
-            )
-            market = response.json().get("market", response.json())
-            result = market.get("result", "")
+            result = futures[ticker].result()
 
             if result not in ("yes", "no"):
                 # Not resolved yet — check again next cycle
-                time.sleep(0.15)
                 continue
 
             # Calculate PnL in cents
@@ -135,44 +172,47 @@ def resolve_paper_trades():
             else:  # BUY NO
                 pnl = entry_price if result == "no" else -(100 - entry_price)
 
-            exit_time  = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            file_exists = os.path.isfile(PAPER_TRADE_LOG)
-
-            try:
-                with open(PAPER_TRADE_LOG, "a", newline="") as f:
-                    writer = csv.DictWriter(f, fieldnames=PAPER_TRADE_FIELDNAMES)
-                    if not file_exists:
-                        writer.writeheader()
-                    writer.writerow({
-                        "entry_time":               pos["entry_time"],
-                        "exit_time":                exit_time,
-                        "city":                     pos["city"],
-                        "market_type":              pos["market_type"],
-                        "bucket_label":             pos["bucket_label"],
-                        "ticker":                   ticker,
-                        "direction":                direction,
-                        "entry_price":              entry_price,
-                        "exit_result":              result,
-                        "pnl_cents":                pnl,
-                        "gap_at_entry":             pos["gap_at_entry"],
-                        "spread_at_entry":          pos["spread_at_entry"] if pos["spread_at_entry"] is not None else "",
-                        "std_dev_at_entry":         pos["std_dev_at_entry"],
-                        "time_decay_at_entry":      pos["time_decay_at_entry"],
-                        "nws_prob_at_entry":        pos["nws_prob_at_entry"],
-                        "forecast_temp_at_entry":   pos["forecast_temp_at_entry"] if pos["forecast_temp_at_entry"] is not None else "",
-                        "consensus_at_entry":        pos["consensus_at_entry"] if pos["consensus_at_entry"] is not None else "",
-                        "hourly_adjusted_at_entry": pos["hourly_adjusted_at_entry"],
-                    })
-            except Exception as csv_err:
-                log.error(f"Paper trade CSV write failed for {ticker}: {csv_err}")
-
+            out_rows.append({
+                "entry_time":               pos["entry_time"],
+                "exit_time":                exit_time,
+                "city":                     pos["city"],
+                "market_type":              pos["market_type"],
+                "bucket_label":             pos["bucket_label"],
+                "ticker":                   ticker,
+                "direction":                direction,
+                "entry_price":              entry_price,
+                "exit_result":              result,
+                "pnl_cents":                pnl,
+                "gap_at_entry":             pos["gap_at_entry"],
+                "spread_at_entry":          pos["spread_at_entry"] if pos["spread_at_entry"] is not None else "",
+                "std_dev_at_entry":         pos["std_dev_at_entry"],
+                "time_decay_at_entry":      pos["time_decay_at_entry"],
+                "nws_prob_at_entry":        pos["nws_prob_at_entry"],
+                "forecast_temp_at_entry":   pos["forecast_temp_at_entry"] if pos["forecast_temp_at_entry"] is not None else "",
+                "consensus_at_entry":        pos["consensus_at_entry"] if pos["consensus_at_entry"] is not None else "",
+                "hourly_adjusted_at_entry": pos["hourly_adjusted_at_entry"],
+            })
             resolved_tickers.append(ticker)
             log.info(f"📝 PAPER RESOLVED: {ticker} → {result}, PnL: {pnl:+.0f}¢")
 
         except Exception as exc:
             log.error(f"resolve_paper_trades: error checking {ticker}: {exc}")
 
-        time.sleep(0.15)   # Be respectful to the Kalshi API
+    # Append all resolved trades in one open/write instead of one per ticker
+    if out_rows:
+        try:
+            # Only stat the file the first time; after that we know the
+            # header is there because we found the file or wrote it ourselves.
+            if _PAPER_LOG_HAS_HEADER is None:
+                _PAPER_LOG_HAS_HEADER = os.path.isfile(PAPER_TRADE_LOG)
+            with open(PAPER_TRADE_LOG, "a", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=PAPER_TRADE_FIELDNAMES)
+                if not _PAPER_LOG_HAS_HEADER:
+                    writer.writeheader()
+                    _PAPER_LOG_HAS_HEADER = True
+                writer.writerows(out_rows)
+        except Exception as csv_err:
+            log.error(f"Paper trade CSV write failed for {len(out_rows)} trade(s): {csv_err}")
 
     for ticker in resolved_tickers:
         del _PAPER_POSITIONS[ticker]
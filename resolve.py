@@ -22,39 +22,36 @@ market data is publicly readable without an API key).
 
 import os
 import csv
-import math
 import time
-import logging
-import schedule
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
-from dotenv import load_dotenv
+from datetime import datetime, timedelta, timezone
 import requests
-from config import CITIES
+from concurrent.futures import ThreadPoolExecutor
+from observations import _asos_fahrenheit
+from config import (
+    CITIES, KALSHI_BASE_URL, LOG_FILE, RESOLVE_LOG, SESSION, KALSHI_RATE_LIMIT,
+    log, _et_now, _ticker_market_date,
+)
 
 # ============================================================
 # SECTION 1 — SETUP
 # ============================================================
 
-load_dotenv()
-
-# Kalshi REST API base URL — same as bot.py
-KALSHI_BASE_URL = "https://api.elections.kalshi.com/trade-api/v2"
+# .env loading, the Kalshi base URL, the log file paths (LOG_PATH /
+# RESOLVE_LOG_PATH env vars), the logging format, the shared HTTP session and
+# the Kalshi rate limit all come from config.py — the same settings bot.py
+# uses, so the two scripts can't drift apart.
 
-# Log files — respect same env vars as bot.py so Railway config stays simple
-LOG_FILE    = os.getenv("LOG_PATH",         "log.csv")
-RESOLVE_LOG = os.getenv("RESOLVE_LOG_PATH", "resolve_log.csv")
+# was_settled is written by logging_csv.py as a Python bool, i.e. "True".
+# Comparing against the spellings directly avoids a .lower() copy per row.
+_TRUE_STRS = frozenset({"True", "true", "TRUE"})
 
-# Date guard — prevents the 9:30 AM check from firing twice if the process
-# is still running when the scheduler ticks a minute later.
-_RAN_FOR_DATE = None
+# Reverse lookup: city display name (as logged in log.csv) → city_key,
+# e.g. "New York City" → "NYC". CITIES is fixed, so it's built once here.
+_NAME_TO_KEY = {city["name"]: city_key for city_key, city in CITIES.items()}
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
-log = logging.getLogger(__name__)
+# True once RESOLVE_LOG is known to have its header row. None = not checked
+# yet (first write after startup) — same idea as logging_csv.py.
+_RESOLVE_LOG_HAS_HEADER = None
 
 # Columns written to resolve_log.csv
 RESOLVE_FIELDNAMES = [
@@ -81,7 +78,12 @@ def fetch_market_result(ticker):
     we still record it, but the caller can note this if needed.
     """
     try:
-        response = requests.get(
+        # Wait for a slot in the shared Kalshi budget (see config.KALSHI_RATE_LIMIT)
+        KALSHI_RATE_LIMIT.acquire()
+
+        # Shared keep-alive session from config — every ticker after the first
+        # reuses the open connection to Kalshi instead of a fresh TLS handshake.
+        response = SESSION.get(
             f"{KALSHI_BASE_URL}/markets/{ticker}",
             timeout=10,
         )
@@ -93,16 +95,9 @@ def fetch_market_result(ticker):
         response.raise_for_status()
 
         # Single-market endpoint wraps the object in {"market": {...}}
-        data        = response.json()
-        market      = data.get("market") or data   # defensive: handle both formats
-        result      = market.get("result", "")
-        provisional = market.get("is_provisional", False)
-
-        if result in ("yes", "no"):
-            return result, provisional
-
-        # Empty string means not yet settled
-        return None, False
+        data   = response.json()
+        market = data.get("market") or data   # defensive: handle both formats
+        return _market_outcome(market)
 
     except requests.exceptions.RequestException as e:
         log.error(f"  {ticker}: API request failed — {e}")
@@ -112,6 +107,63 @@ def fetch_market_result(ticker):
         return None, False
 
 
+def _market_outcome(market):
+    """
+    Turns one Kalshi market object into (result, provisional) — result is
+    "yes"/"no", or None if not settled yet (result="").
+    """
+    result      = market.get("result", "")
+    provisional = market.get("is_provisional", False)
+
+    if result in ("yes", "no"):
+        return result, provisional
+
+    # Empty string means not yet settled
+    return None, False
+
+
+# Most tickers Kalshi's list endpoint will look up in one request.
+KALSHI_BATCH_SIZE = 20
+
+
+def fetch_market_results_batch(tickers):
+    """
+    Looks up many markets with as few requests as possible: the list
+    endpoint (/markets?tickers=A,B,C) returns up to KALSHI_BATCH_SIZE
+    markets per call, so 60 tickers cost 3 round trips instead of 60.
+
+    Returns {ticker: (result, provisional)} — same tuple as
+    fetch_market_result() — for every ticker Kalshi sent back. Tickers
+    from a failed request, or that Kalshi left out, are simply missing;
+    the caller looks those up one by one. Never raises.
+    """
+    outcomes = {}
+
+    for i in range(0, len(tickers), KALSHI_BATCH_SIZE):
+        chunk = tickers[i:i + KALSHI_BATCH_SIZE]
+        try:
+            KALSHI_RATE_LIMIT.acquire()
+            response = SESSION.get(
+                f"{KALSHI_BASE_URL}/markets",
+                params={"tickers": ",".join(chunk), "limit": len(chunk)},
+                timeout=10,
+            )
+            response.raise_for_status()
+
+            wanted = set(chunk)
+            for market in response.json().get("markets", []):
+                ticker = market.get("ticker")
+                if ticker in wanted:
+                    outcomes[ticker] = _market_outcome(market)
+
+        except requests.exceptions.RequestException as e:
+            log.warning(f"  Batch market lookup failed for {len(chunk)} tickers — {e}")
+        except Exception as e:
+            log.warning(f"  Batch market lookup: unexpected error — {e}")
+
+    return outcomes
+
+
 # ============================================================
 # SECTION 2.5 — FETCH ACTUAL TEMPERATURE FROM NWS OBSERVATIONS
 # ============================================================
@@ -131,6 +183,7 @@ def fetch_actual_temperature(station, date, station_type, lst_utc_offset):
 
     Temperature conversion:
       ASOS (5-minute) : official_F = math.floor(celsius * 9/5 + 32)
+                        (exact integer version: observations._asos_fahrenheit)
       Hourly (manual) : official_F = round(celsius * 9/5 + 32)
 
     The maxTemperatureLast24Hours (DSM) field, if present on any observation,
@@ -149,10 +202,11 @@ def fetch_actual_temperature(station, date, station_type, lst_utc_offset):
         start_str = start_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
         end_str   = end_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        response = requests.get(
+        # Shared session from config: keep-alive to api.weather.gov across
+        # stations, retries on 5xx/429, and the User-Agent NWS requires.
+        response = SESSION.get(
             f"https://api.weather.gov/stations/{station}/observations",
             params={"start": start_str, "end": end_str, "limit": 500},
-            headers={"User-Agent": "KalshiClimateBot/1.0"},
             timeout=15,
         )
         response.raise_for_status()
@@ -163,35 +217,42 @@ def fetch_actual_temperature(station, date, station_type, lst_utc_offset):
             log.warning(f"  {station}: no observations returned for {date}")
             return None
 
-        actual_high = None
-        actual_low  = None
+        # Per-reading °F values, collected first and reduced with the builtin
+        # max()/min() after the loop — same approach as
+        # observations.get_current_running_extremes().
+        readings_f = []   # individual temperature observations
+        dsm_f      = []   # DSM (Daily Summary Message) highs
+
+        # Station type is fixed for the whole day — decide the rounding rule
+        # once, not once per reading.
+        is_asos = station_type == "5-minute"
 
         for obs in features:
-            props  = obs.get("properties", {})
+            props  = obs.get("properties") or {}
 
-            # Current temperature reading from this observation
-            temp_c = (props.get("temperature") or {}).get("value")
+            # Current temperature reading from this observation.
+            # (No `or {}` fallback dict per field — a missing field is just None.)
+            temp_obj = props.get("temperature")
+            temp_c   = temp_obj.get("value") if temp_obj else None
             if temp_c is not None:
-                if station_type == "5-minute":
-                    temp_f = math.floor(temp_c * 9 / 5 + 32)
+                if is_asos:
+                    readings_f.append(_asos_fahrenheit(temp_c)[0])   # floor(C × 9/5 + 32)
                 else:   # hourly / cooperative observer
-                    temp_f = round(temp_c * 9 / 5 + 32)
+                    readings_f.append(round(temp_c * 9 / 5 + 32))
 
-                if actual_high is None or temp_f > actual_high:
-                    actual_high = temp_f
-                if actual_low is None or temp_f < actual_low:
-                    actual_low = temp_f
-
-            # DSM (Daily Summary Message) field — overrides computed high if higher.
+            # DSM field — overrides the computed high if higher (below).
             # Use the same rounding rule as the station type.
-            max_24h_c = (props.get("maxTemperatureLast24Hours") or {}).get("value")
+            dsm_obj   = props.get("maxTemperatureLast24Hours")
+            max_24h_c = dsm_obj.get("value") if dsm_obj else None
             if max_24h_c is not None:
-                if station_type == "5-minute":
-                    max_24h_f = math.floor(max_24h_c * 9 / 5 + 32)
+                if is_asos:
+                    dsm_f.append(_asos_fahrenheit(max_24h_c)[0])
                 else:
-                    max_24h_f = round(max_24h_c * 9 / 5 + 32)
-                if actual_high is None or max_24h_f > actual_high:
-                    actual_high = max_24h_f
+                    dsm_f.append(round(max_24h_c * 9 / 5 + 32))
+
+        # High = highest of every reading and every DSM high; low = lowest reading
+        actual_high = max(readings_f + dsm_f) if (readings_f or dsm_f) else None
+        actual_low  = min(readings_f) if readings_f else None
 
         if actual_high is None and actual_low is None:
             log.warning(f"  {station}: no valid temperature readings for {date}")
@@ -207,44 +268,54 @@ def fetch_actual_temperature(station, date, station_type, lst_utc_offset):
         return None
 
 
+def _fetch_city_actuals(city_key, date):
+    """fetch_actual_temperature() for one city_key, using its station config."""
+    city_conf = CITIES[city_key]
+    log.info(f"  Fetching NWS actuals for {city_conf['name']} ({city_conf['nws_station']})...")
+    return fetch_actual_temperature(
+        city_conf["nws_station"],
+        date,
+        city_conf["station_type"],
+        city_conf["lst_utc_offset"],
+    )
+
+
 # ============================================================
-# SECTION 2.8 — LOOK UP FORECAST TEMP FROM LOG.CSV
+# SECTION 3 — LOAD YESTERDAY'S SIGNALS FROM LOG.CSV
 # ============================================================
 
-def _get_forecast_for_ticker(ticker, log_path):
+def _find_rows_since(f, data_start, cutoff):
     """
-    Scans log.csv for all rows matching this ticker and returns the
-    forecast_temp_used value from the last (most recent) matching row.
+    Binary-searches an open (binary mode) log.csv for where rows logged on
+    or after `cutoff` begin, and returns a byte offset to start reading from.
 
-    forecast_temp_used is the temperature that drove the Gaussian probability
-    calculation — it's either the live observed running high/low (for today
-    markets with observations) or the NWS grid forecast (for tomorrow markets
-    or early-morning today markets with no observations yet).
+    log.csv is append-only and every row starts with its "YYYY-MM-DD HH:MM:SS"
+    timestamp, so rows are already in time order. Instead of reading months
+    of history, we jump to the middle, look at the first full row there,
+    and keep halving until the window is small. The returned offset may be a
+    little early (up to ~64 KB of older rows) but never late.
 
-    Returns an int (°F) if found, or None if the ticker has no logged rows
-    with a non-empty forecast_temp_used.
-    """
-    if not os.path.isfile(log_path):
-        return None
+      f          — log.csv opened with "rb"
+      data_start — byte offset just past the header row
+      cutoff     — b"YYYY-MM-DD"
 
-    forecast_temp = None
-    try:
-        with open(log_path, newline="", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row.get("ticker") == ticker and row.get("forecast_temp_used", "").strip():
-                    forecast_temp = row["forecast_temp_used"]
-        # Returns the last match — most recent cycle logged for this ticker
-        return int(float(forecast_temp)) if forecast_temp else None
-    except Exception as e:
-        log.warning(f"  _get_forecast_for_ticker({ticker}): {e}")
-        return None
+    If the offset isn't data_start it falls mid-row; the caller skips to the
+    next line before parsing.
+    """
+    lo = data_start
+    hi = os.fstat(f.fileno()).st_size
+    while hi - lo > 64 * 1024:
+        mid = (lo + hi) // 2
+        f.seek(mid)
+        f.readline()          # finish the row we landed in the middle of
+        row = f.readline()    # first full row after mid
+        if not row or row[:10] >= cutoff:
+            hi = mid          # that row is recent enough — look earlier
+        else:
+            lo = mid          # still too old — everything before it is too
+    return lo
 
 
-# ============================================================
-# SECTION 3 — LOAD YESTERDAY'S SIGNALS FROM LOG.CSV
-# ============================================================
-
 def load_yesterday_signals():
     """
     Reads log.csv and returns all HIGH-confidence signals whose Kalshi
@@ -261,57 +332,108 @@ def load_yesterday_signals():
     we keep the LAST row — the reading closest to market close, which is the
     most relevant snapshot for accuracy evaluation.
 
+    The same pass also records each of yesterday's tickers' forecast_temp_used
+    from its last logged row that has one — before the was_settled/confidence
+    filters, so a market's final forecast counts even if its last row was
+    filtered out. forecast_temp_used is the temperature that drove the
+    Gaussian probability calculation: the live observed running high/low (for
+    today markets with observations) or the NWS grid forecast (otherwise).
+
     Returns:
-      by_ticker   — dict  {ticker: row_dict}
-      yesterday   — "YYYY-MM-DD" string (the date being evaluated)
+      by_ticker          — dict  {ticker: row_dict}
+      yesterday_et       — datetime.date (the date being evaluated, in ET)
+      forecast_by_ticker — dict  {ticker: int °F}
     """
-    et            = datetime.now(tz=ZoneInfo("America/New_York"))
+    et            = _et_now()
     yesterday_et  = (et - timedelta(days=1)).date()
-    yesterday_str = yesterday_et.strftime("%Y-%m-%d")
 
-    by_ticker = {}
+    by_ticker          = {}
+    forecast_by_ticker = {}
 
     if not os.path.isfile(LOG_FILE):
         log.error(f"Log file not found: {LOG_FILE}")
-        return by_ticker, yesterday_str
+        return by_ticker, yesterday_et, forecast_by_ticker
 
-    try:
-        with open(LOG_FILE, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
+    # Every ticker carries its market date, e.g. "KXHIGHNY-26FEB18-B48.5", so
+    # any row for yesterday's markets contains the text "-26FEB18-". log.csv
+    # holds every market from every cycle ever logged, so checking each raw
+    # line for that tag first lets us skip almost all rows without decoding
+    # them or building a row dict. Rows that pass still go through the full
+    # checks below.
+    tag = yesterday_et.strftime("-%y%b%d-").upper().encode()
 
-                # Skip rows from old schema (no ticker column)
-                if not row.get("ticker"):
+    try:
+        with open(LOG_FILE, "rb") as f:
+            header = next(csv.reader([f.readline().decode("utf-8")]), [])
+
+            # Skip straight to the last few days of rows. Yesterday's markets
+            # are logged from the day before (as "tomorrow" markets) until
+            # they close, so anything logged 3+ days before yesterday can't
+            # be one of them. Only possible when timestamp is the first column.
+            if header[:1] == ["timestamp"]:
+                cutoff = (yesterday_et - timedelta(days=3)).isoformat().encode()
+                data_start = f.tell()
+                start = _find_rows_since(f, data_start, cutoff)
+                f.seek(start)
+                if start != data_start:
+                    f.readline()   # landed mid-row — start at the next full one
+
+            # Rows from an old CSV schema without a ticker column can't be resolved
+            if "ticker" not in header:
+                log.error(f"{LOG_FILE} has no 'ticker' column — delete it so the bot recreates it.")
+                return by_ticker, yesterday_et, forecast_by_ticker
+
+            # Column positions, looked up once. Rows are read as plain lists
+            # (csv.reader) and only the few that become signals are turned
+            # into a {column: value} dict — DictReader would build one per row.
+            ticker_col     = header.index("ticker")
+            settled_col    = header.index("was_settled")
+            confidence_col = header.index("confidence")
+            forecast_col   = header.index("forecast_temp_used") if "forecast_temp_used" in header else None
+            num_cols       = len(header)
+
+            lines = (line.decode("utf-8") for line in f if tag in line)
+            for row in csv.reader(lines):
+
+                # Skip truncated rows (e.g. a partial write) and rows with no ticker
+                if len(row) < num_cols or not row[ticker_col]:
                     continue
+                ticker = row[ticker_col]
 
                 # Parse the resolution date from the ticker.
                 # Ticker format: "KXHIGHNY-26FEB18-B48.5"
                 # The middle segment is the date in YYMONDD format.
-                try:
-                    date_part    = row["ticker"].split("-")[1]   # e.g. "26FEB18"
-                    resolve_date = datetime.strptime(date_part, "%y%b%d").date()
-                except (IndexError, ValueError):
-                    continue
+                # (None if it doesn't parse, which never equals yesterday.)
+                resolve_date = _ticker_market_date(ticker)
 
                 # Only markets that resolved on yesterday's ET date
                 if resolve_date != yesterday_et:
                     continue
 
-                # Exclude already-settled markets (no edge, just noise)
-                if row.get("was_settled", "").lower() == "true":
+                # Forecast that drove this reading (last non-empty one wins)
+                fc_used = row[forecast_col].strip() if forecast_col is not None else ""
+                if fc_used:
+                    try:
+                        forecast_by_ticker[ticker] = int(float(fc_used))
+                    except ValueError:
+                        pass
+
+                # Only high-confidence signals (NWS was clearly on one side).
+                # Checked first: it rejects more rows than was_settled does.
+                if row[confidence_col] != "HIGH":
                     continue
 
-                # Only high-confidence signals (NWS was clearly on one side)
-                if row.get("confidence", "") != "HIGH":
+                # Exclude already-settled markets (no edge, just noise)
+                if row[settled_col] in _TRUE_STRS:
                     continue
 
                 # Last occurrence wins — most recent reading before close
-                by_ticker[row["ticker"]] = row
+                by_ticker[ticker] = dict(zip(header, row))
 
     except Exception as e:
         log.error(f"Error reading {LOG_FILE}: {e}")
 
-    return by_ticker, yesterday_str
+    return by_ticker, yesterday_et, forecast_by_ticker
 
 
 # ============================================================
@@ -323,17 +445,25 @@ def write_resolve_log(rows):
     Appends resolution results to resolve_log.csv.
     Creates the file with a header on the first run.
     """
+    global _RESOLVE_LOG_HAS_HEADER
+
     if not rows:
         return
 
-    file_exists = os.path.isfile(RESOLVE_LOG)
+    # In schedule mode this process writes once a day for weeks — stat the
+    # file on the first write only, then trust the flag.
+    if _RESOLVE_LOG_HAS_HEADER is None:
+        _RESOLVE_LOG_HAS_HEADER = os.path.isfile(RESOLVE_LOG)
     try:
         with open(RESOLVE_LOG, "a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=RESOLVE_FIELDNAMES)
-            if not file_exists:
-                writer.writeheader()
+            # Plain csv.writer: each row dict is read out in RESOLVE_FIELDNAMES
+            # order (the single source of column order) and written as a list.
+            writer = csv.writer(f)
+            if not _RESOLVE_LOG_HAS_HEADER:
+                writer.writerow(RESOLVE_FIELDNAMES)
+                _RESOLVE_LOG_HAS_HEADER = True
                 log.info(f"Created {RESOLVE_LOG} with header row.")
-            writer.writerows(rows)
+            writer.writerows([r[k] for k in RESOLVE_FIELDNAMES] for r in rows)
         log.info(f"Appended {len(rows)} rows to {RESOLVE_LOG}.")
     except Exception as e:
         log.error(f"Failed to write to {RESOLVE_LOG}: {e}")
@@ -356,9 +486,7 @@ def print_summary(date_str, rows):
       - Breakdown by market type (HIGH vs LOW)
       - Breakdown by city with net PnL per city
     """
-    total   = len(rows)
-    net_pnl = sum(r["pnl_cents"] for r in rows)
-    correct = sum(1 for r in rows if r["resolved_correct"] is True)
+    total = len(rows)
 
     DIVIDER = "=" * 52
 
@@ -372,9 +500,40 @@ def print_summary(date_str, rows):
         print(f"{DIVIDER}\n")
         return
 
+    # One pass over the rows collects everything the tables below need:
+    #   net_pnl / correct — day totals
+    #   by_type           — {"HIGH": [net_pnl, trades], ...}
+    #   by_city_type      — {("Miami", "HIGH"): [net_pnl, trades], ...}
+    #   errors_by_city    — {"Miami": [abs forecast error °F, ...], ...}
+    net_pnl        = 0
+    correct        = 0
+    by_type        = {}
+    by_city_type   = {}
+    errors_by_city = {}
+    for r in rows:
+        net_pnl += r["pnl_cents"]
+        if r["resolved_correct"] is True:
+            correct += 1
+
+        for totals in (
+            by_type.setdefault(r["market_type"], [0, 0]),
+            by_city_type.setdefault((r["city"], r["market_type"]), [0, 0]),
+        ):
+            totals[0] += r["pnl_cents"]
+            totals[1] += 1
+
+        # Only rows where we fetched the actual observed temperature have an
+        # error. forecast_error = NWS forecast − actual (°F); we report MAE.
+        if r.get("forecast_error", "") != "":
+            city_errors = errors_by_city.setdefault(r["city"], [])
+            try:
+                city_errors.append(abs(float(r["forecast_error"])))
+            except (ValueError, TypeError):
+                pass
+
     pnl_sign = "+" if net_pnl >= 0 else ""
     print(f"  Trades evaluated : {total}")
-    print(f"  Net PnL          : {pnl_sign}{net_pnl:.0f}¢  (${net_pnl / 100:.2f} per unit)")
+    print(f"  Net PnL          : {pnl_sign}{net_pnl}¢  (${net_pnl / 100:.2f} per unit)")
     print(f"  Win rate         : {correct}/{total} ({correct / total * 100:.1f}%)")
     print()
 
@@ -382,47 +541,36 @@ def print_summary(date_str, rows):
     print(f"  {'TYPE':<6}  {'TRADES':>6}  {'NET PnL':>9}  {'AVG PnL':>9}")
     print(f"  {'-' * 38}")
     for mtype in ("HIGH", "LOW"):
-        subset = [r for r in rows if r["market_type"] == mtype]
-        if not subset:
+        if mtype not in by_type:
             continue
-        sp   = sum(r["pnl_cents"] for r in subset)
-        avg  = sp / len(subset)
-        print(f"  {mtype:<6}  {len(subset):>6}  {'+' if sp >= 0 else ''}{sp:>7.0f}¢  {'+' if avg >= 0 else ''}{avg:>7.1f}¢")
+        sp, count = by_type[mtype]
+        avg       = sp / count
+        print(f"  {mtype:<6}  {count:>6}  {'+' if sp >= 0 else ''}{sp:>7d}¢  {'+' if avg >= 0 else ''}{avg:>7.1f}¢")
 
     print()
 
     # ── By city ─────────────────────────────────────────────────────────
-    def pnl_str(subset):
-        """Returns 'PnL¢/N trades' or '—' if the subset is empty."""
-        if not subset:
+    def pnl_str(totals):
+        """Returns 'PnL¢/N trades' or '—' if there were no trades."""
+        if totals is None:
             return "—"
-        sp = sum(r["pnl_cents"] for r in subset)
-        return f"{'+' if sp >= 0 else ''}{sp:.0f}¢/{len(subset)}"
+        sp, count = totals
+        return f"{'+' if sp >= 0 else ''}{sp}¢/{count}"
 
     print(f"  {'CITY':<22}  {'HIGH':>10}  {'LOW':>8}")
     print(f"  {'-' * 46}")
-    for city in sorted({r["city"] for r in rows}):
-        city_rows = [r for r in rows if r["city"] == city]
-        high_str  = pnl_str([r for r in city_rows if r["market_type"] == "HIGH"])
-        low_str   = pnl_str([r for r in city_rows if r["market_type"] == "LOW"])
+    for city in sorted({city for city, _ in by_city_type}):
+        high_str  = pnl_str(by_city_type.get((city, "HIGH")))
+        low_str   = pnl_str(by_city_type.get((city, "LOW")))
         print(f"  {city:<22}  {high_str:>10}  {low_str:>8}")
 
     # ── NWS forecast accuracy (MAE by city) ─────────────────────────────────
-    # Only rows where we successfully fetched the actual observed temperature
-    # contribute. forecast_error = NWS forecast − actual (in °F); we report MAE.
-    mae_rows = [r for r in rows if r.get("forecast_error", "") != ""]
-    if mae_rows:
+    if errors_by_city:
         print()
         print(f"  NWS FORECAST ERROR (mean absolute error vs observed)")
         print(f"  {'-' * 46}")
-        for city in sorted({r["city"] for r in mae_rows}):
-            city_subset = [r for r in mae_rows if r["city"] == city]
-            errors = []
-            for r in city_subset:
-                try:
-                    errors.append(abs(float(r["forecast_error"])))
-                except (ValueError, TypeError):
-                    pass
+        for city in sorted(errors_by_city):
+            errors = errors_by_city[city]
             if errors:
                 mae = sum(errors) / len(errors)
                 print(f"  {city:<22}  Avg Error: {mae:.1f}°F")
@@ -444,12 +592,8 @@ def run_resolution_check():
       5. Append results to resolve_log.csv
       6. Print the PnL + forecast accuracy summary
     """
-    global _RAN_FOR_DATE
-
-    et            = datetime.now(tz=ZoneInfo("America/New_York"))
-    _RAN_FOR_DATE = et.date()
-
-    signals, yesterday_str = load_yesterday_signals()
+    signals, resolve_date_obj, forecast_by_ticker = load_yesterday_signals()
+    yesterday_str = resolve_date_obj.isoformat()   # "YYYY-MM-DD" for logs and resolve_log.csv
 
     print(f"\n{'=' * 52}")
     print(f"  RESOLUTION CHECK — {yesterday_str}")
@@ -464,31 +608,68 @@ def run_resolution_check():
 
     log.info(f"Checking {len(signals)} unique markets for {yesterday_str}...")
 
-    # Build a reverse lookup: display name → city_key (e.g. "New York City" → "NYC")
-    name_to_key = {v["name"]: k for k, v in CITIES.items()}
-
-    # Parse the resolution date once — used for NWS observation lookups below
-    resolve_date_obj = datetime.strptime(yesterday_str, "%Y-%m-%d").date()
-
-    # Cache NWS actual temps by city_key so we only hit the API once per city,
-    # not once per ticker (a city can have many buckets in signals).
-    # Value is {"actual_high": int, "actual_low": int} or None if fetch failed.
-    actuals_cache = {}
+    # ── Skip cities whose day hasn't ended yet ─────────────────────────────
+    # A market covers one calendar day in the city's local STANDARD time, so
+    # it can't settle before midnight LST at the end of that day — e.g.
+    # 03:00 ET for Los Angeles in winter. Only matters for an early --now run;
+    # at 9:30 ET every city has closed. Those cities' tickers are reported as
+    # not yet settled without asking Kalshi or NWS.
+    now_utc     = datetime.now(timezone.utc)
+    day_after   = datetime.combine(resolve_date_obj + timedelta(days=1), datetime.min.time())
+    open_cities = set()
+    for city_key, city in CITIES.items():
+        lst = timezone(timedelta(hours=city["lst_utc_offset"]))
+        if now_utc < day_after.replace(tzinfo=lst):
+            open_cities.add(city_key)
+    if open_cities:
+        log.info(f"  Too early to resolve {', '.join(sorted(open_cities))} — day not over in local standard time")
+
+    # Tickers worth looking up (unknown city names are still checked)
+    to_check = [
+        ticker for ticker, row in signals.items()
+        if _NAME_TO_KEY.get(row["city"]) not in open_cities
+    ]
+
+    # ── Fetch everything up front, in one thread pool ──────────────────────
+    # Every market's result from Kalshi, plus the NWS actual temps once per
+    # city (a city can have many buckets in signals). All of it is network
+    # wait, so the NWS requests run in the pool while Kalshi is queried in
+    # batches here — the whole step takes about as long as the slower of the
+    # two, not their sum. Kalshi calls still share KALSHI_RATE_LIMIT. None of
+    # the fetch functions raise.
+    cities_needed = {_NAME_TO_KEY[row["city"]] for row in signals.values() if row["city"] in _NAME_TO_KEY} - open_cities
+    with ThreadPoolExecutor(max_workers=12) as pool:
+        actual_futures = {
+            city_key: pool.submit(_fetch_city_actuals, city_key, resolve_date_obj)
+            for city_key in cities_needed
+        }
+
+        # {ticker: (result, provisional)}
+        market_results = fetch_market_results_batch(to_check)
+
+        # Anything the batch calls didn't return — look up one by one
+        missing        = [ticker for ticker in to_check if ticker not in market_results]
+        result_futures = {ticker: pool.submit(fetch_market_result, ticker) for ticker in missing}
+
+    market_results.update({ticker: future.result() for ticker, future in result_futures.items()})
+    for ticker in signals:
+        market_results.setdefault(ticker, (None, False))   # skipped above — not settled yet
+    # {city_key: {"actual_high": int, "actual_low": int} or None if fetch failed}
+    actuals_cache  = {city_key: future.result() for city_key, future in actual_futures.items()}
 
     resolved_rows = []
 
     for ticker, row in signals.items():
-        result, provisional = fetch_market_result(ticker)
-
-        # Pause briefly between calls to be respectful of Kalshi's API
-        time.sleep(0.15)
+        result, provisional = market_results[ticker]
 
         if result is None:
             log.info(f"  {ticker}: not yet settled — skipping")
             continue
 
         direction   = row["direction"]   # "BUY YES" or "BUY NO"
-        entry_price = float(row["kalshi_price"])
+        # Kalshi prices are whole cents — keep PnL as an int all the way
+        # through (resolve_log.csv gets "22", not "22.0").
+        entry_price = int(round(float(row["kalshi_price"])))
         correct     = (
             (direction == "BUY YES" and result == "yes") or
             (direction == "BUY NO"  and result == "no")
@@ -505,7 +686,7 @@ def run_resolution_check():
         #   Win (NO wins, YES settles 0):  receive 100¢, paid 78¢ → gain 22¢ (= entry_price)
         #   Loss (NO loses, YES settles 100): receive 0¢, paid 78¢ → lose 78¢ (= 100 - entry_price)
         if result in ("void", "voided"):
-            pnl = 0.0   # refunded — no gain or loss
+            pnl = 0     # refunded — no gain or loss
         elif direction == "BUY YES":
             pnl = (100 - entry_price) if result == "yes" else -entry_price
         else:  # BUY NO
@@ -517,28 +698,18 @@ def run_resolution_check():
         pnl_sign = "+" if pnl >= 0 else ""
         log.info(
             f"  {icon} {ticker}: signal={direction}, resolved={result}{prov_tag}, "
-            f"pnl={pnl_sign}{pnl:.0f}¢"
+            f"pnl={pnl_sign}{pnl}¢"
         )
 
         # ── Fetch actual temperature from NWS ─────────────────────────────
-        city_key  = name_to_key.get(row["city"])
-        city_conf = CITIES.get(city_key) if city_key else None
+        # One lookup: display name → city_key. The city's station config was
+        # already used when actuals_cache was fetched above.
+        city_key = _NAME_TO_KEY.get(row["city"])
 
         actual_temp    = ""
         forecast_error = ""
 
-        if city_conf:
-            # Fetch once per city; reuse the cached result for subsequent tickers
-            if city_key not in actuals_cache:
-                log.info(f"  Fetching NWS actuals for {row['city']} ({city_conf['nws_station']})...")
-                actuals_cache[city_key] = fetch_actual_temperature(
-                    city_conf["nws_station"],
-                    resolve_date_obj,
-                    city_conf["station_type"],
-                    city_conf["lst_utc_offset"],
-                )
-                time.sleep(0.15)   # be polite to the NWS API
-
+        if city_key is not None:
             actuals = actuals_cache[city_key]
             if actuals:
                 actual_temp = (
@@ -548,9 +719,8 @@ def run_resolution_check():
 
                 # forecast_error = forecast_temp_used − actual observed temp (°F).
                 # Positive = model predicted too high; negative = too low.
-                # Look up from log.csv via the helper so we always get the correct
-                # column name (forecast_temp_used) regardless of CSV schema history.
-                forecast_temp = _get_forecast_for_ticker(ticker, LOG_FILE)
+                # Captured from log.csv in the same pass as the signals.
+                forecast_temp = forecast_by_ticker.get(ticker)
                 if forecast_temp is not None and actual_temp != "":
                     forecast_error = round(forecast_temp - actual_temp, 1)
                 else:
@@ -585,7 +755,8 @@ def run_resolution():
     """
     Public entry point for running the daily resolution check.
     Called by bot.py's run_cycle() at 9:30 AM ET.
-    Returns the number of markets resolved (0 if none found or already run today).
+    bot.py keeps its own once-a-day guard, so this always runs the check.
+    Returns the number of markets resolved (0 if none found).
     """
     return run_resolution_check()
 
@@ -597,10 +768,15 @@ def run_resolution():
 #   python resolve.py          — schedule mode: fires at 9:30 AM ET daily
 #   python resolve.py --now    — run one check immediately and exit
 #
-# Why not schedule.every().day.at("09:30")?
-# The schedule library uses local system time. On Railway (UTC), "09:30"
-# would mean 9:30 AM UTC, not 9:30 AM ET. Instead, we check every minute
-# and fire when it's 9:30 AM in America/New_York — correct regardless of DST.
+# Why sleep until 9:30 instead of polling the clock?
+# The process only has one job a day. Working out how long it is until the
+# next 9:30 AM ET and sleeping exactly that long means it wakes once a day
+# instead of twice a minute, and it can't fire twice for the same morning.
+# The target is built in America/New_York, so it stays 9:30 ET across DST.
+#
+# Started (or redeployed) between 9:30 and 10:00 AM ET? Then this morning's
+# check hasn't run yet, so it runs straight away instead of waiting for
+# tomorrow — ran_for_date makes sure that only happens once per morning.
 #
 # Why 9:30 AM ET (not 8 AM)?
 # West Coast stations (LAX, SFO, SEA) are UTC-8. Their Kalshi markets
@@ -609,11 +785,23 @@ def run_resolution():
 # ET = 6:30 AM PT gives them enough time to file before we check.
 # ============================================================
 
-def _maybe_run():
-    """Called every minute — fires the check at 9:30 AM ET, once per day."""
-    et_now = datetime.now(tz=ZoneInfo("America/New_York"))
-    if et_now.hour == 9 and et_now.minute >= 30 and _RAN_FOR_DATE != et_now.date():
-        run_resolution_check()
+def _seconds_until_next_run(ran_for_date):
+    """
+    Returns the number of seconds from now until the next 9:30 AM ET check,
+    or 0 if it's between 9:30 and 10:00 AM ET and today's check hasn't run
+    yet. ran_for_date is the ET date of the last check (None if none yet).
+    """
+    et_now = _et_now()
+    if et_now.hour == 9 and et_now.minute >= 30 and ran_for_date != et_now.date():
+        return 0
+
+    target = et_now.replace(hour=9, minute=30, second=0, microsecond=0)
+    if et_now >= target:
+        # Already past 9:30 today — next run is tomorrow morning
+        target += timedelta(days=1)
+    # Compare as timestamps: subtracting two datetimes in the same zone
+    # ignores a DST change in between, which would leave us an hour off.
+    return target.timestamp() - et_now.timestamp()
 
 
 if __name__ == "__main__":
@@ -632,11 +820,14 @@ if __name__ == "__main__":
     log.info("  Run with --now to test immediately")
     log.info("=" * 52)
 
-    schedule.every(1).minutes.do(_maybe_run)
+    ran_for_date = None   # ET date of the last check run by this loop
 
     try:
         while True:
-            schedule.run_pending()
-            time.sleep(30)
+            wait = _seconds_until_next_run(ran_for_date)
+            log.info(f"Next resolution check in {wait / 3600:.1f} hours.")
+            time.sleep(wait)
+            ran_for_date = _et_now().date()
+            run_resolution_check()
     except KeyboardInterrupt:
         log.info("Resolution checker stopped.")